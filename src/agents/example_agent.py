@@ -68,7 +68,7 @@ class ExampleAgent(BaseAgent):
         response_events = [];
 
         for event in events_for_me:
-            if event.eventType == EventType.UTTERANCE:
+            if event.eventType is EventType.UTTERANCE:
                 # Extract utterance text from parameters
                 utterance_text = "";
                 if (
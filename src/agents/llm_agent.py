@@ -2,7 +2,7 @@
 LLM Agent - Agent with real LLM integration (OpenAI, Anthropic, etc.)
 """
 
-from typing import Optional
+from typing import Any, AsyncIterator, Optional
 import structlog
 import os
 
@@ -31,7 +31,8 @@ class LLMAgent(BaseAgent):
         model_name: Optional[str] = None,
         system_prompt: Optional[str] = None,
         serviceUrl: Optional[str] = None,
-        agent_version: str = "1.1.0"
+        agent_version: str = "1.1.0",
+        client: Optional[Any] = None
     ) -> None:
         """
         Initialize LLM agent
@@ -44,6 +45,8 @@ class LLMAgent(BaseAgent):
             system_prompt: System prompt for the LLM
             serviceUrl: Optional service URL
             agent_version: Agent version
+            client: Optional pre-built LLM client to share across agents
+                (e.g. an AsyncOpenAI instance); created lazily when omitted
         """
         super().__init__(
             speakerUri=speakerUri,
@@ -55,7 +58,7 @@ class LLMAgent(BaseAgent):
         self.llm_provider = llm_provider.lower()
         self.model_name = model_name or self._get_default_model()
         self.system_prompt = system_prompt or self._get_default_system_prompt()
-        self._llm_client = None
+        self._llm_client = client
         self._conversation_history: dict[str, list] = {}
 
     def _get_default_model(self) -> str:
@@ -228,6 +231,26 @@ Be concise, helpful, and collaborative with other agents in the conversation."""
             self._conversation_history[conversation_id] = \
                 self._conversation_history[conversation_id][-10:] 
 
+    def record_exchange(
+        self,
+        conversation_id: str,
+        utterance_text: str,
+        response_text: str
+    ) -> None:
+        """
+        Record an utterance and its response without calling the LLM
+
+        Keeps the history consistent when a response was obtained elsewhere,
+        e.g. served from a cache instead of generate_response.
+
+        Args:
+            conversation_id: Conversation identifier
+            utterance_text: Text of the utterance
+            response_text: Response to record for it
+        """
+        self._add_to_history(conversation_id, "user", utterance_text) 
+        self._add_to_history(conversation_id, "assistant", response_text) 
+
     async def handle_envelope(
         self,
         envelope: OpenFloorEnvelope
@@ -253,7 +276,7 @@ Be concise, helpful, and collaborative with other agents in the conversation."""
         response_events = [] 
 
         for event in events_for_me:
-            if event.eventType == EventType.UTTERANCE:
+            if event.eventType is EventType.UTTERANCE:
                 # Extract utterance text
                 utterance_text = "" 
                 if (
@@ -318,6 +341,45 @@ Be concise, helpful, and collaborative with other agents in the conversation."""
 
         return response_envelope
 
+    async def generate_response(
+        self,
+        conversation_id: str,
+        utterance_text: str
+    ) -> str:
+        """
+        Generate an LLM response, raising on provider errors
+
+        Unlike process_utterance, failures are not turned into a fallback
+        reply, so callers can tell them apart from real responses.
+
+        Args:
+            conversation_id: Conversation identifier
+            utterance_text: Text of the utterance
+
+        Returns:
+            LLM response text
+        """
+        # Add user message to history
+        self._add_to_history(conversation_id, "user", utterance_text) 
+
+        # Call appropriate LLM provider
+        if self.llm_provider == "openai":
+            response = await self._call_openai(conversation_id, utterance_text) 
+        elif self.llm_provider == "anthropic":
+            response = await self._call_anthropic(conversation_id, utterance_text) 
+        elif self.llm_provider == "ollama":
+            response = await self._call_ollama(conversation_id, utterance_text) 
+        else:
+            raise ValueError(f"Unsupported provider: {self.llm_provider}") 
+
+        logger.info(
+            "LLM response generated",
+            speakerUri=self.speakerUri,
+            response_length=len(response)
+        ) 
+
+        return response 
+
     async def process_utterance(
         self,
         conversation_id: str,
@@ -344,26 +406,68 @@ Be concise, helpful, and collaborative with other agents in the conversation."""
         ) 
 
         try:
-            # Add user message to history
+            return await self.generate_response(conversation_id, utterance_text) 
+
+        except Exception as e:
+            logger.error(
+                "Error calling LLM",
+                speakerUri=self.speakerUri,
+                provider=self.llm_provider,
+                error=str(e)
+            ) 
+            return f"I apologize, but I encountered an error: {str(e)}" 
+
+    async def stream_utterance(
+        self,
+        conversation_id: str,
+        utterance_text: str,
+        sender_speakerUri: str
+    ) -> AsyncIterator[str]:
+        """
+        Process utterance using LLM, yielding the response as it is generated
+
+        Only OpenAI supports token streaming; other providers yield the full
+        response from process_utterance as a single chunk.
+
+        Args:
+            conversation_id: Conversation identifier
+            utterance_text: Text of the utterance
+            sender_speakerUri: Speaker URI of the sender
+
+        Yields:
+            Response text chunks
+        """
+        if self.llm_provider != "openai":
+            response = await self.process_utterance(
+                conversation_id,
+                utterance_text,
+                sender_speakerUri
+            ) 
+            if response:
+                yield response 
+            return
+
+        chunks = [] 
+        try:
             self._add_to_history(conversation_id, "user", utterance_text) 
+            self._init_llm_client() 
 
-            # Call appropriate LLM provider
-            if self.llm_provider == "openai":
-                response = await self._call_openai(conversation_id, utterance_text) 
-            elif self.llm_provider == "anthropic":
-                response = await self._call_anthropic(conversation_id, utterance_text) 
-            elif self.llm_provider == "ollama":
-                response = await self._call_ollama(conversation_id, utterance_text) 
-            else:
-                raise ValueError(f"Unsupported provider: {self.llm_provider}") 
+            messages = self._get_conversation_messages(conversation_id, utterance_text) 
 
-            logger.info(
-                "LLM response generated",
-                speakerUri=self.speakerUri,
-                response_length=len(response)
+            stream = await self._llm_client.chat.completions.create(
+                model=self.model_name,
+                messages=messages,
+                temperature=0.7,
+                stream=True
             ) 
 
-            return response 
+            async for chunk in stream:
+                if not chunk.choices:
+                    continue
+                token = chunk.choices[0].delta.content 
+                if token:
+                    chunks.append(token) 
+                    yield token 
 
         except Exception as e:
             logger.error(
@@ -372,5 +476,7 @@ Be concise, helpful, and collaborative with other agents in the conversation."""
                 provider=self.llm_provider,
                 error=str(e)
             ) 
-            return f"I apologize, but I encountered an error: {str(e)}" 
+            yield f"I apologize, but I encountered an error: {str(e)}" 
+            return
 
+        self._add_to_history(conversation_id, "assistant", "".join(chunks)) 
@@ -9,6 +9,7 @@ from pydantic import BaseModel
 from typing import Optional, Dict, Any
 import structlog
 
+from src.api.floor import get_floor_control
 from src.floor_manager.manager import FloorManager
 from src.floor_manager.envelope import (
     OpenFloorEnvelope,
@@ -30,10 +31,13 @@ def get_floor_manager() -> FloorManager:
     Get Floor Manager instance
     
     Per OFP 1.0.1: Floor Manager includes envelope routing
+    
+    Floor decisions go to the same FloorControl as the /floor endpoints, so
+    requestFloor/yieldFloor envelopes change the floor those endpoints report.
     """
     global _floor_manager
     if _floor_manager is None:
-        _floor_manager = FloorManager();
+        _floor_manager = FloorManager(convener=get_floor_control());
     return _floor_manager
 
 
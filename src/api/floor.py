@@ -26,6 +26,15 @@ def get_floor_control() -> FloorControl:
     return _floor_control
 
 
+async def _broadcast_floor_status(conversation_id: str, floor_control: FloorControl) -> None:
+    """Push the current floor holder to WebSocket/SSE subscribers"""
+    # Imported here: src.api.websocket imports get_floor_control from this module
+    from src.api.websocket import broadcast_floor_update
+
+    holder = await floor_control.get_floor_holder(conversation_id);
+    await broadcast_floor_update(conversation_id, {"holder": holder});
+
+
 class FloorRequest(BaseModel):
     """Request floor model"""
     conversation_id: str
@@ -71,6 +80,9 @@ async def request_floor(
 
     holder = await floor_control.get_floor_holder(request.conversation_id);
 
+    if granted:
+        await _broadcast_floor_status(request.conversation_id, floor_control);
+
     return FloorResponse(
         conversation_id=request.conversation_id,
         granted=granted,
@@ -105,6 +117,9 @@ async def release_floor(
             detail="Floor not held by this agent"
         );
 
+    # Release may have granted the floor to the next requester in queue
+    await _broadcast_floor_status(release.conversation_id, floor_control);
+
     return {
         "conversation_id": release.conversation_id,
         "released": True
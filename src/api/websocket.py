@@ -15,8 +15,8 @@ logger = structlog.get_logger()
 # Store active WebSocket connections
 active_websockets: Set[WebSocket] = set()
 
-# Store active SSE connections (conversation_id -> asyncio.Queue)
-active_sse_queues: dict[str, asyncio.Queue] = {}
+# Store active SSE connections (conversation_id -> one asyncio.Queue per subscriber)
+active_sse_queues: dict[str, Set[asyncio.Queue]] = {}
 
 
 async def broadcast_floor_update(conversation_id: str, floor_status: dict) -> None:
@@ -47,9 +47,9 @@ async def broadcast_floor_update(conversation_id: str, floor_status: dict) -> No
     active_websockets.difference_update(disconnected)
     
     # Broadcast to SSE connections
-    if conversation_id in active_sse_queues:
+    for queue in active_sse_queues.get(conversation_id, ()):
         try:
-            await active_sse_queues[conversation_id].put(message_json)
+            queue.put_nowait(message_json)
         except Exception as e:
             logger.warning("SSE queue put failed", error=str(e))
 
@@ -88,12 +88,10 @@ async def websocket_floor_endpoint(websocket: WebSocket, conversation_id: str) -
         holder = await floor_control.get_floor_holder(conversation_id)
         
         # Get queue from floor requests
-        queue = []
-        if conversation_id in floor_control._floor_requests:
-            queue = [
-                {"speakerUri": req["speakerUri"], "priority": req["priority"]}
-                for req in floor_control._floor_requests[conversation_id]
-            ]
+        queue = [
+            {"speakerUri": req["speakerUri"], "priority": req["priority"]}
+            for req in floor_control.get_queued_requests(conversation_id)
+        ]
         
         await websocket.send_json({
             "type": "initial_status",
@@ -138,9 +136,9 @@ async def sse_event_generator(conversation_id: str):
     - Rate limiting per IP/user
     - Connection limits per conversation_id
     """
-    # Create queue for this conversation
+    # Create queue for this subscriber
     queue = asyncio.Queue()
-    active_sse_queues[conversation_id] = queue
+    active_sse_queues.setdefault(conversation_id, set()).add(queue)
     
     try:
         # Send initial status
@@ -148,12 +146,10 @@ async def sse_event_generator(conversation_id: str):
         holder = await floor_control.get_floor_holder(conversation_id)
         
         # Get queue from floor requests
-        queue_status = []
-        if conversation_id in floor_control._floor_requests:
-            queue_status = [
-                {"speakerUri": req["speakerUri"], "priority": req["priority"]}
-                for req in floor_control._floor_requests[conversation_id]
-            ]
+        queue_status = [
+            {"speakerUri": req["speakerUri"], "priority": req["priority"]}
+            for req in floor_control.get_queued_requests(conversation_id)
+        ]
         
         initial_data = json.dumps({
             "type": "initial_status",
@@ -181,8 +177,11 @@ async def sse_event_generator(conversation_id: str):
                 
     finally:
         # Cleanup
-        if conversation_id in active_sse_queues:
-            del active_sse_queues[conversation_id]
+        subscribers = active_sse_queues.get(conversation_id)
+        if subscribers is not None:
+            subscribers.discard(queue)
+            if not subscribers:
+                del active_sse_queues[conversation_id]
 
 
 def create_sse_endpoint(router):
@@ -198,7 +197,7 @@ def create_sse_endpoint(router):
         Server-Sent Events endpoint for real-time floor status.
         
         Usage in browser:
-            const eventSource = new EventSource('http://localhost:8000/api/v1/events/floor/conv_001');
+            const eventSource = new EventSource('http://localhost:8000/api/v1/floor/events/floor/conv_001');
             eventSource.onmessage = (event) => {
                 const data = JSON.parse(event.data);
                 console.log('Floor update:', data);
@@ -16,6 +16,7 @@ class Settings(BaseSettings):
     ENVIRONMENT: str = "development"
     DEBUG: bool = True
     LOG_LEVEL: str = "INFO"
+    LOG_FLUSH_INTERVAL: float = 0.01  # Seconds to batch log lines after the first one
 
     # Server
     HOST: str = "0.0.0.0"
@@ -57,11 +58,13 @@ class Settings(BaseSettings):
     FLOOR_TIMEOUT: int = 30
     FLOOR_MAX_HOLD_TIME: int = 300
     FLOOR_QUEUE_MAX_SIZE: int = 100
+    FLOOR_MAX_CONVERSATIONS: int = 10000  # LRU cap on per-conversation floor state
 
     # Envelope Router
     ROUTER_MAX_RETRIES: int = 3
     ROUTER_TIMEOUT: int = 10
     ROUTER_QUEUE_SIZE: int = 1000
+    ROUTER_WORKERS: int = 16
 
     # Agent Registry
     REGISTRY_CLEANUP_INTERVAL: int = 60
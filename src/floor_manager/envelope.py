@@ -4,6 +4,7 @@ Conversation Envelope - OFP 1.1.0 Interoperable Conversation Envelope Specificat
 
 from datetime import datetime
 from enum import Enum
+from functools import cached_property
 from typing import Optional, Dict, Any, List
 from pydantic import BaseModel, Field, ConfigDict
 
@@ -41,6 +42,8 @@ class SchemaObject(BaseModel):
     )
     
     model_config = ConfigDict(
+        # Immutable so one instance can be shared across envelopes
+        frozen=True,
         # Avoid shadowing BaseModel.schema
         json_schema_extra={"examples": [{"version": "1.1.0"}]}
     )
@@ -83,6 +86,9 @@ class ConversationObject(BaseModel):
         None,
         description="Array of speakerURIs for conversants who currently have floor rights"
     )
+    
+    # Immutable so instances can be shared across envelopes
+    model_config = ConfigDict(frozen=True)
 
 
 class SenderObject(BaseModel):
@@ -92,6 +98,9 @@ class SenderObject(BaseModel):
         None,
         description="URL of the sender service"
     )
+    
+    # Immutable (and hashable) so instances can be shared across envelopes
+    model_config = ConfigDict(frozen=True)
 
 
 class ToObject(BaseModel):
@@ -103,6 +112,16 @@ class ToObject(BaseModel):
     speakerUri: Optional[str] = Field(None, description="URI of intended recipient")
     serviceUrl: Optional[str] = Field(None, description="URL of intended recipient")
     private: bool = Field(False, description="Whether event is private (only for utterance events)")
+    
+    # Immutable (and hashable) so instances can be shared across events
+    model_config = ConfigDict(frozen=True)
+
+
+class RequestFloorParams(BaseModel):
+    """Parameters of a requestFloor event"""
+    priority: int = Field(0, description="Floor request priority (higher is served first)")
+    
+    model_config = ConfigDict(extra="allow")
 
 
 class EventObject(BaseModel):
@@ -121,6 +140,11 @@ class EventObject(BaseModel):
         description="Event-specific parameters"
     )
 
+    @cached_property
+    def request_floor_params(self) -> RequestFloorParams:
+        """Typed view of parameters for requestFloor events, parsed once"""
+        return RequestFloorParams.model_validate(self.parameters or {})
+
 
 class OpenFloorEnvelope(BaseModel):
     """
@@ -155,6 +179,8 @@ class OpenFloorEnvelope(BaseModel):
     events: List[EventObject] = Field(..., description="List of events")
 
     model_config = ConfigDict(
+        # Routed envelopes are shared by reference between all recipients
+        frozen=True,
         populate_by_name=True,  # Allow both alias "schema" and attribute name "schema_obj"
         json_encoders={
             datetime: lambda v: v.isoformat()
@@ -162,8 +188,18 @@ class OpenFloorEnvelope(BaseModel):
     )
 
     def to_dict(self) -> dict:
-        """Convert envelope to dictionary with openFloor wrapper"""
-        return {"openFloor": self.model_dump(exclude_none=True)}
+        """Convert envelope to dictionary with openFloor wrapper (OFP field names)"""
+        return {"openFloor": self.model_dump(by_alias=True, exclude_none=True)}
+
+    @cached_property
+    def to_json_bytes(self) -> bytes:
+        """
+        JSON encoding of to_dict(), computed once per envelope
+        
+        Lets every recipient of a broadcast send the same bytes instead of
+        re-serializing the envelope per handler.
+        """
+        return b'{"openFloor":' + self.model_dump_json(by_alias=True, exclude_none=True).encode() + b"}"
 
     @classmethod
     def from_dict(cls, data: dict) -> "OpenFloorEnvelope":
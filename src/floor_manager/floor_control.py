@@ -8,9 +8,15 @@ NOTE: "Convener" in OFP spec refers to an optional AGENT that mediates conversat
       not this component. This is the Floor Manager's built-in floor control logic.
 """
 
+from bisect import insort
+from dataclasses import dataclass, field
 from datetime import datetime, timedelta, UTC
-from typing import Optional, Dict, Any
+from collections import OrderedDict
+from types import MappingProxyType
+from typing import Optional, Any, List, Mapping
 from enum import Enum
+import logging
+import sys
 import structlog
 
 from src.config import settings
@@ -18,6 +24,30 @@ from src.config import settings
 logger = structlog.get_logger()
 
 
+def _request_order(request: dict) -> tuple:
+    """Queue order: higher priority first, then earlier requests"""
+    return (-request["priority"], request["timestamp"])
+
+
+# Metadata values are immutable (read-only mappings, tuples), so the
+# read-only view from get_conversation_metadata is read-only all the way down
+_NO_FLOOR_ROLES: Mapping[str, tuple] = MappingProxyType({})
+
+
+def _new_metadata() -> dict:
+    """Default conversation metadata (assignedFloorRoles can include a convener)"""
+    return {"assignedFloorRoles": _NO_FLOOR_ROLES}
+
+
+@dataclass(slots=True)
+class _ConversationState:
+    """All floor state of one conversation, evicted as a unit"""
+    holder: Optional[dict] = None
+    # Sorted by _request_order
+    requests: List[dict] = field(default_factory=list)
+    metadata: dict = field(default_factory=_new_metadata)
+
+
 class FloorState(Enum):
     """Floor state enumeration"""
     IDLE = "idle"
@@ -39,6 +69,11 @@ class FloorControl:
     NOTE: This is NOT the "Convener" from OFP spec. The spec's "Convener" 
           is an optional AGENT that mediates conversations. This is the 
           Floor Manager's built-in floor control logic.
+    
+    Concurrency: all state changes happen in synchronous helpers with no
+    await in between, so on a single event loop every public method is
+    atomic and no asyncio.Lock is needed. Keep it that way: do not add
+    awaits inside the state-mutating helpers.
     """
 
     def __init__(self, floor_manager_speakerUri: Optional[str] = None) -> None:
@@ -49,14 +84,18 @@ class FloorControl:
             floor_manager_speakerUri: Speaker URI of the Floor Manager
                                       If None, uses default from settings
         """
-        self._floor_holders: dict[str, dict] = {}
-        self._floor_requests: dict[str, list] = {}
+        # Per-conversation state (holder, queue, metadata) is kept in one
+        # record per conversation, in LRU order and capped at
+        # FLOOR_MAX_CONVERSATIONS so long-running processes do not leak
+        self._conversations: OrderedDict[str, _ConversationState] = OrderedDict()
         self._floor_timeout = settings.FLOOR_TIMEOUT
+        self._floor_timeout_delta = timedelta(seconds=self._floor_timeout)
         self._max_hold_time = settings.FLOOR_MAX_HOLD_TIME
+        self._max_hold_delta = timedelta(seconds=self._max_hold_time)
+        self._max_conversations = settings.FLOOR_MAX_CONVERSATIONS
         # Floor Manager identification per OFP 1.1.0
         # Note: If an optional Convener Agent exists, it would be tracked in assignedFloorRoles
         self.floor_manager_speakerUri = floor_manager_speakerUri or "tag:floor.manager,2025:manager"
-        self._conversation_metadata: dict[str, dict] = {}  # Track conversation metadata
 
     async def request_floor(
         self,
@@ -81,40 +120,38 @@ class FloorControl:
         Returns:
             True if floor granted immediately, False if queued
         """
-        logger.info(
-            "Floor request received by Floor Manager",
-            conversation_id=conversation_id,
-            speakerUri=speakerUri,
-            priority=priority,
-            floor_manager=self.floor_manager_speakerUri
-        )
-
-        # Initialize conversation metadata if needed
-        if conversation_id not in self._conversation_metadata:
-            self._conversation_metadata[conversation_id] = {
-                # Note: assignedFloorRoles can include "convener" if a Convener Agent exists
-                # For now, we only track the Floor Manager
-                "assignedFloorRoles": {}
-            }
+        # Speaker URIs come from a small, heavily reused set; interning them
+        # (and the conversation key) lets dict lookups and holder comparisons
+        # short-circuit on identity
+        conversation_id = sys.intern(conversation_id)
+        speakerUri = sys.intern(speakerUri)
+
+        # Skip building the event dict when INFO is filtered out (hot path)
+        if logger.is_enabled_for(logging.INFO):
+            logger.info(
+                "Floor request received by Floor Manager",
+                conversation_id=conversation_id,
+                speakerUri=speakerUri,
+                priority=priority,
+                floor_manager=self.floor_manager_speakerUri
+            )
+
+        # Initialize conversation state (and metadata) if needed
+        state = self._state(conversation_id, create=True)
 
         # Check if floor is available (Floor Manager decision)
-        if conversation_id not in self._floor_holders:
-            await self._grant_floor(conversation_id, speakerUri);
+        if state.holder is None:
+            self._grant_floor(state, conversation_id, speakerUri);
             return True
 
         # Add to request queue (Floor Manager will process later)
-        if conversation_id not in self._floor_requests:
-            self._floor_requests[conversation_id] = []
-
         request = {
             "speakerUri": speakerUri,
             "priority": priority,
             "timestamp": datetime.now(UTC)
         }
-        self._floor_requests[conversation_id].append(request);
-        self._floor_requests[conversation_id].sort(
-            key=lambda x: (-x["priority"], x["timestamp"])
-        );
+        # Binary insertion keeps the queue sorted without a full re-sort
+        insort(state.requests, request, key=_request_order);
 
         return False
 
@@ -133,28 +170,25 @@ class FloorControl:
         Returns:
             True if floor was released, False if agent didn't hold floor
         """
-        logger.info(
-            "Floor yield received by Floor Manager",
-            conversation_id=conversation_id,
-            speakerUri=speakerUri,
-            floor_manager=self.floor_manager_speakerUri
-        )
-
-        if conversation_id not in self._floor_holders:
-            return False
+        if logger.is_enabled_for(logging.INFO):
+            logger.info(
+                "Floor yield received by Floor Manager",
+                conversation_id=conversation_id,
+                speakerUri=speakerUri,
+                floor_manager=self.floor_manager_speakerUri
+            )
 
-        holder = self._floor_holders[conversation_id];
-        if holder["speakerUri"] != speakerUri:
+        state = self._state(conversation_id)
+        if state is None or state.holder is None or state.holder["speakerUri"] != speakerUri:
             return False
 
-        del self._floor_holders[conversation_id];
+        state.holder = None;
         
         # Clear floorGranted in conversation metadata
-        if conversation_id in self._conversation_metadata:
-            self._conversation_metadata[conversation_id].pop("floorGranted", None);
+        state.metadata.pop("floorGranted", None);
 
         # Floor Manager grants floor to next requester in queue
-        await self._process_queue(conversation_id);
+        self._process_queue(state, conversation_id);
 
         return True
 
@@ -168,20 +202,40 @@ class FloorControl:
         Returns:
             Speaker URI holding the floor, or None
         """
-        if conversation_id not in self._floor_holders:
+        state = self._state(conversation_id)
+        if state is None or state.holder is None:
             return None
+        holder = state.holder
 
-        holder = self._floor_holders[conversation_id];
         # Check if floor grant has expired
-        if datetime.now(UTC) - holder["granted_at"] > timedelta(
-            seconds=self._max_hold_time
-        ):
-            await self._revoke_floor(conversation_id, reason="@timeout");
+        if datetime.now(UTC) - holder["granted_at"] > self._max_hold_delta:
+            self._revoke_floor(state, conversation_id, reason="@timeout");
             return None
 
         return holder["speakerUri"]
 
-    async def _grant_floor(self, conversation_id: str, speakerUri: str) -> None:
+    def get_queued_requests(self, conversation_id: str) -> tuple:
+        """
+        Get the queued floor requests for a conversation
+
+        Args:
+            conversation_id: Unique conversation identifier
+
+        Returns:
+            Snapshot of the queued request dicts (speakerUri, priority,
+            timestamp), in the order they will be granted
+        """
+        state = self._state(conversation_id)
+        if state is None:
+            return ()
+        return tuple(state.requests)
+
+    def _grant_floor(
+        self,
+        state: _ConversationState,
+        conversation_id: str,
+        speakerUri: str
+    ) -> None:
         """
         Grant floor to an agent per OFP 1.1.0 Section 1.20 (grantFloor)
         
@@ -190,41 +244,43 @@ class FloorControl:
         Per OFP 1.1.0: floorGranted is an array of speakerURIs with floor rights.
         """
         granted_at = datetime.now(UTC);
-        self._floor_holders[conversation_id] = {
+        state.holder = {
             "speakerUri": speakerUri,
             "granted_at": granted_at
         };
         
         # Update conversation metadata with floorGranted per OFP 1.1.0
-        if conversation_id not in self._conversation_metadata:
-            self._conversation_metadata[conversation_id] = {
-                "assignedFloorRoles": {}  # Can include convener if Convener Agent present
-            };
-        
-        # OFP 1.1.0: floorGranted is an array of speakerURIs (simplified from 1.0.1)
-        self._conversation_metadata[conversation_id]["floorGranted"] = [speakerUri];
+        # OFP 1.1.0: floorGranted is an array of speakerURIs (simplified from 1.0.1),
+        # kept as a tuple so metadata readers cannot modify it
+        state.metadata["floorGranted"] = (speakerUri,);
         
-        logger.info(
-            "Floor granted by Floor Manager",
-            conversation_id=conversation_id,
-            speakerUri=speakerUri,
-            floor_manager=self.floor_manager_speakerUri,
-            granted_at=granted_at
-        );
-
-    async def _revoke_floor(self, conversation_id: str, reason: str = "@timeout") -> None:
+        if logger.is_enabled_for(logging.INFO):
+            logger.info(
+                "Floor granted by Floor Manager",
+                conversation_id=conversation_id,
+                speakerUri=speakerUri,
+                floor_manager=self.floor_manager_speakerUri,
+                granted_at=granted_at.isoformat()
+            );
+
+    def _revoke_floor(
+        self,
+        state: _ConversationState,
+        conversation_id: str,
+        reason: str = "@timeout"
+    ) -> None:
         """
         Revoke floor due to timeout or other reason per OFP 1.1.0 Section 1.21 (revokeFloor)
         
         Floor Manager decision (e.g., timeout, override).
         """
-        if conversation_id in self._floor_holders:
-            speakerUri = self._floor_holders[conversation_id]["speakerUri"];
-            del self._floor_holders[conversation_id];
+        holder = state.holder
+        if holder is not None:
+            speakerUri = holder["speakerUri"];
+            state.holder = None;
             
             # Clear floorGranted in conversation metadata
-            if conversation_id in self._conversation_metadata:
-                self._conversation_metadata[conversation_id].pop("floorGranted", None);
+            state.metadata.pop("floorGranted", None);
             
             logger.warning(
                 "Floor revoked by Floor Manager",
@@ -233,35 +289,120 @@ class FloorControl:
                 reason=reason,
                 floor_manager=self.floor_manager_speakerUri
             );
-            await self._process_queue(conversation_id);
+            self._process_queue(state, conversation_id);
     
-    def get_conversation_metadata(self, conversation_id: str) -> Dict[str, Any]:
+    def get_conversation_metadata(self, conversation_id: str) -> Mapping[str, Any]:
         """
         Get conversation metadata including assignedFloorRoles and floorGranted
         
         Returns metadata per OFP 1.1.0 Section 1.6 (conversation object structure).
         
         Note: 
-        - assignedFloorRoles: Dict[str, List[str]] mapping roles to arrays of speakerURIs
-        - floorGranted: List[str] of speakerURIs with floor rights
+        - assignedFloorRoles: read-only mapping of roles to tuples of speakerURIs
+        - floorGranted: tuple of speakerURIs with floor rights
         - assignedFloorRoles can include "convener" key if a Convener Agent
           (per OFP spec) is participating. Currently not implemented.
+        - The result is a read-only view of the live metadata and its values
+          are immutable, so callers do not need to copy it defensively.
+        """
+        state = self._state(conversation_id)
+        if state is None:
+            # Empty by default, can be populated if Convener Agent exists
+            return MappingProxyType(_new_metadata());
+        return MappingProxyType(state.metadata);
+
+    def _process_queue(self, state: _ConversationState, conversation_id: str) -> None:
         """
-        return self._conversation_metadata.get(conversation_id, {
-            "assignedFloorRoles": {}  # Empty by default, can be populated if Convener Agent exists
-        });
-
-    async def _process_queue(self, conversation_id: str) -> None:
-        """Process floor request queue"""
-        if (
-            conversation_id not in self._floor_requests
-            or not self._floor_requests[conversation_id]
-        ):
+        Process floor request queue
+        
+        Requests that waited longer than FLOOR_TIMEOUT are dropped, wherever
+        they sit in the queue, and each drop is logged; the floor is then
+        granted to the first remaining request.
+        """
+        queue = state.requests
+        if not queue:
             return
 
-        next_request = self._floor_requests[conversation_id].pop(0);
-        await self._grant_floor(conversation_id, next_request["speakerUri"]);
+        expired_before = datetime.now(UTC) - self._floor_timeout_delta
+        fresh = []
+        for request in queue:
+            if request["timestamp"] >= expired_before:
+                fresh.append(request)
+                continue
+            logger.warning(
+                "Expired floor request dropped by Floor Manager",
+                conversation_id=conversation_id,
+                speakerUri=request["speakerUri"],
+                reason="@timeout",
+                floor_manager=self.floor_manager_speakerUri
+            );
+
+        # Filtering keeps the queue sorted; update it in place
+        queue[:] = fresh[1:];
+
+        if fresh:
+            self._grant_floor(state, conversation_id, fresh[0]["speakerUri"]);
 
-        if not self._floor_requests[conversation_id]:
-            del self._floor_requests[conversation_id];
+    def _state(
+        self,
+        conversation_id: str,
+        create: bool = False
+    ) -> Optional[_ConversationState]:
+        """
+        Look up a conversation's state and mark it as most recently used
 
+        Reads refresh recency too, so conversations that are only polled stay
+        cached. With create=True, missing state is added and conversations
+        are evicted past the cap (see _evict_one).
+        """
+        conversations = self._conversations
+        state = conversations.get(conversation_id)
+        if state is not None:
+            conversations.move_to_end(conversation_id)
+        elif create:
+            state = conversations[conversation_id] = _ConversationState()
+            while len(conversations) > self._max_conversations:
+                self._evict_one(conversation_id)
+        return state
+
+    def _evict_one(self, keep_id: str) -> None:
+        """
+        Evict the least recently used idle conversation
+        
+        Idle means no holder and no queued requests. Only if every other
+        conversation is active is the least recently used one evicted
+        anyway: its queue is dropped and its floor revoked (@evicted), both
+        logged at WARNING.
+        """
+        victim_id = None
+        for candidate_id, candidate in self._conversations.items():
+            if candidate_id == keep_id:
+                continue
+            if candidate.holder is None and not candidate.requests:
+                victim_id = candidate_id
+                break
+            if victim_id is None:
+                victim_id = candidate_id
+
+        victim = self._conversations[victim_id]
+        if victim.holder is not None or victim.requests:
+            for request in victim.requests:
+                logger.warning(
+                    "Floor request dropped by Floor Manager",
+                    conversation_id=victim_id,
+                    speakerUri=request["speakerUri"],
+                    reason="@evicted",
+                    floor_manager=self.floor_manager_speakerUri
+                );
+            victim.requests.clear();
+            self._revoke_floor(victim, victim_id, reason="@evicted");
+            logger.warning(
+                "Evicted active conversation state",
+                conversation_id=victim_id
+            );
+        else:
+            logger.debug(
+                "Evicted least recently used conversation state",
+                conversation_id=victim_id
+            )
+        del self._conversations[victim_id]
@@ -4,6 +4,8 @@ Floor Queue - Manages floor request queues
 
 from typing import List, Optional
 from datetime import datetime
+import heapq
+import itertools
 import structlog
 
 from src.config import settings
@@ -14,11 +16,22 @@ logger = structlog.get_logger()
 class FloorQueue:
     """
     Manages floor request queues per conversation
+
+    Each queue is a binary heap of ``[-priority, seq, request]`` entries, so the
+    highest priority (and, on ties, the earliest) request is always on top.
+    Removal is lazy: remove_agent() only blanks the request slot of the
+    agent's entries, and blanked entries are discarded when they reach the top
+    of the heap (or when they make up more than half of it).
     """
 
     def __init__(self) -> None:
         """Initialize floor queue"""
-        self._queues: dict[str, List[dict]] = {};
+        self._queues: dict[str, List[list]] = {};
+        # conversation_id -> agent_id -> live heap entries of that agent
+        self._entries: dict[str, dict[str, List[list]]] = {};
+        # conversation_id -> number of removed entries still in the heap
+        self._removed: dict[str, int] = {};
+        self._counter = itertools.count();
         self._max_size = settings.FLOOR_QUEUE_MAX_SIZE
 
     def enqueue(
@@ -38,10 +51,9 @@ class FloorQueue:
         Returns:
             True if enqueued, False if queue full
         """
-        if conversation_id not in self._queues:
-            self._queues[conversation_id] = [];
+        queue = self._queues.setdefault(conversation_id, []);
 
-        if len(self._queues[conversation_id]) >= self._max_size:
+        if self.get_queue_size(conversation_id) >= self._max_size:
             logger.warning(
                 "Floor queue full",
                 conversation_id=conversation_id,
@@ -55,16 +67,18 @@ class FloorQueue:
             "timestamp": datetime.utcnow()
         };
 
-        self._queues[conversation_id].append(request);
-        self._queues[conversation_id].sort(
-            key=lambda x: (-x["priority"], x["timestamp"])
-        );
+        # The sequence number keeps FIFO order among equal priorities
+        entry = [-priority, next(self._counter), request];
+        heapq.heappush(queue, entry);
+        self._entries.setdefault(conversation_id, {}).setdefault(
+            agent_id, []
+        ).append(entry);
 
         logger.debug(
             "Agent enqueued",
             conversation_id=conversation_id,
             agent_id=agent_id,
-            queue_position=len(self._queues[conversation_id])
+            queue_position=self.get_queue_size(conversation_id)
         );
 
         return True
@@ -79,13 +93,24 @@ class FloorQueue:
         Returns:
             Next request dict or None if queue empty
         """
-        if (
-            conversation_id not in self._queues
-            or not self._queues[conversation_id]
-        ):
+        queue = self._queues.get(conversation_id)
+        if not queue:
             return None
 
-        return self._queues[conversation_id].pop(0);
+        self._discard_removed(conversation_id, queue);
+        if not queue:
+            return None
+
+        entry = heapq.heappop(queue);
+        request = entry[2];
+
+        agents = self._entries[conversation_id];
+        entries = agents[request["agent_id"]];
+        entries.remove(entry);
+        if not entries:
+            del agents[request["agent_id"]];
+
+        return request;
 
     def peek(self, conversation_id: str) -> Optional[dict]:
         """
@@ -97,13 +122,15 @@ class FloorQueue:
         Returns:
             Next request dict or None if queue empty
         """
-        if (
-            conversation_id not in self._queues
-            or not self._queues[conversation_id]
-        ):
+        queue = self._queues.get(conversation_id)
+        if not queue:
+            return None
+
+        self._discard_removed(conversation_id, queue);
+        if not queue:
             return None
 
-        return self._queues[conversation_id][0];
+        return queue[0][2];
 
     def get_queue_size(self, conversation_id: str) -> int:
         """
@@ -115,9 +142,10 @@ class FloorQueue:
         Returns:
             Queue size
         """
-        if conversation_id not in self._queues:
-            return 0
-        return len(self._queues[conversation_id]);
+        return (
+            len(self._queues.get(conversation_id, ()))
+            - self._removed.get(conversation_id, 0)
+        );
 
     def remove_agent(
         self,
@@ -134,24 +162,32 @@ class FloorQueue:
         Returns:
             True if removed, False if not found
         """
-        if conversation_id not in self._queues:
+        entries = self._entries.get(conversation_id, {}).pop(agent_id, None)
+        if not entries:
             return False
 
-        queue = self._queues[conversation_id];
-        original_size = len(queue);
-
-        self._queues[conversation_id] = [
-            req for req in queue if req["agent_id"] != agent_id
-        ];
+        # Lazy deletion: blank the entries, the heap drops them later
+        for entry in entries:
+            entry[2] = None;
 
-        removed = len(self._queues[conversation_id]) < original_size;
+        removed = self._removed.get(conversation_id, 0) + len(entries);
+        queue = self._queues[conversation_id];
+        if removed * 2 > len(queue):
+            queue[:] = [entry for entry in queue if entry[2] is not None];
+            heapq.heapify(queue);
+            removed = 0;
+        self._removed[conversation_id] = removed;
 
-        if removed:
-            logger.debug(
-                "Agent removed from queue",
-                conversation_id=conversation_id,
-                agent_id=agent_id
-            );
+        logger.debug(
+            "Agent removed from queue",
+            conversation_id=conversation_id,
+            agent_id=agent_id
+        );
 
-        return removed;
+        return True;
 
+    def _discard_removed(self, conversation_id: str, queue: List[list]) -> None:
+        """Pop removed entries off the top of the heap"""
+        while queue and queue[0][2] is None:
+            heapq.heappop(queue);
+            self._removed[conversation_id] -= 1;
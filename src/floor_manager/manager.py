@@ -13,8 +13,12 @@ The Floor Manager is responsible for:
 4. Managing conversation state
 """
 
-from typing import Optional, Dict, Callable, List
+from typing import Optional, Dict, Callable, List, Coroutine, Any
 import asyncio
+import logging
+import sys
+from contextvars import ContextVar
+from functools import lru_cache
 import structlog
 from datetime import datetime
 
@@ -32,6 +36,45 @@ from src.floor_manager.floor_control import FloorControl
 
 logger = structlog.get_logger()
 
+# Python 3.12+ can run a task's first step inline: handlers that finish
+# without suspending complete without an extra event-loop round trip
+_EAGER_START = sys.version_info >= (3, 12)
+
+# Set inside routing workers: a handler that routes again must not wait on
+# the (possibly saturated) worker pool it is running in
+_IN_WORKER: ContextVar[bool] = ContextVar("floor_manager_in_worker", default=False)
+
+
+def _start_task(coro: Coroutine[Any, Any, Any]) -> asyncio.Task:
+    """Start a task eagerly when supported"""
+    if _EAGER_START:
+        return asyncio.Task(coro, loop=asyncio.get_running_loop(), eager_start=True)
+    return asyncio.create_task(coro)
+
+
+@lru_cache(maxsize=8)
+def _schema(version: str) -> SchemaObject:
+    """Shared (frozen) schema object for a given OFP version"""
+    return SchemaObject(version=version)
+
+
+@lru_cache(maxsize=4096)
+def _conversation(conversation_id: str) -> ConversationObject:
+    """Shared (frozen) conversation object for a conversation id"""
+    return ConversationObject(id=conversation_id)
+
+
+@lru_cache(maxsize=1024)
+def _sender(speakerUri: str, serviceUrl: Optional[str]) -> SenderObject:
+    """Shared (frozen) sender object"""
+    return SenderObject(speakerUri=speakerUri, serviceUrl=serviceUrl)
+
+
+@lru_cache(maxsize=1024)
+def _to(speakerUri: str, serviceUrl: Optional[str], private: bool) -> ToObject:
+    """Shared (frozen) addressing object"""
+    return ToObject(speakerUri=speakerUri, serviceUrl=serviceUrl, private=private)
+
 
 class FloorManager:
     """
@@ -44,6 +87,9 @@ class FloorManager:
     - Implements minimal behavior if no convener present
     """
     
+    # OFP 1.1.0: Privacy flag only respected for these event types
+    _PRIVACY_EVENTS = frozenset({EventType.UTTERANCE})
+    
     def __init__(self, convener: Optional[FloorControl] = None) -> None:
         """
         Initialize Floor Manager
@@ -53,17 +99,42 @@ class FloorManager:
                      If None, uses minimal first-come-first-served behavior
         """
         # Convener handles floor decisions (or None for minimal behavior)
-        self.convener = convener or FloorControl()
+        self.convener = convener
+        self._minimal = convener is None
         
         # Envelope routing (built into Floor Manager per OFP 1.0.1)
+        # Copy-on-write: never mutated in place, so readers can iterate a
+        # snapshot while routes are (un)registered
         self._routes: Dict[str, Callable] = {}
+        
+        # Delivery jobs for the worker pool (only used while running)
         self._queue: asyncio.Queue = asyncio.Queue(
             maxsize=settings.ROUTER_QUEUE_SIZE
         )
+        self._num_workers = settings.ROUTER_WORKERS
+        self._workers: List[asyncio.Task] = []
+        
+        # Envelopes sent via send_utterance() while running, routed in the
+        # background so senders do not wait on delivery
+        self._outbound: asyncio.Queue = asyncio.Queue(
+            maxsize=settings.ROUTER_QUEUE_SIZE
+        )
+        self._outbound_worker_task: Optional[asyncio.Task] = None
         self._max_retries = settings.ROUTER_MAX_RETRIES
         self._timeout = settings.ROUTER_TIMEOUT
         self._running = False
         
+        # Cached so the per-delivery debug log costs nothing when disabled;
+        # refreshed in start() once logging has been configured
+        self._debug_enabled = logger.is_enabled_for(logging.DEBUG)
+        
+        # Floor control event dispatch; other events are pass-through
+        self._event_handlers: Dict[EventType, Callable] = {
+            EventType.REQUEST_FLOOR: self._handle_request_floor,
+            EventType.YIELD_FLOOR: self._handle_yield_floor,
+            EventType.UTTERANCE: self._handle_utterance
+        }
+        
         logger.info(
             "Floor Manager initialized",
             has_convener=convener is not None
@@ -84,11 +155,15 @@ class FloorManager:
         Note: This is for envelope delivery, NOT agent registration.
         Per OFP 1.1.0, no agent registration exists.
         
+        Every recipient of an envelope receives the same (frozen) instance;
+        handlers must not modify it and can send envelope.to_json_bytes
+        rather than serializing it themselves.
+        
         Args:
             speakerUri: Agent speaker URI (for envelope routing only)
             handler: Async handler function for envelopes
         """
-        self._routes[speakerUri] = handler
+        self._routes = {**self._routes, speakerUri: handler}
         logger.info("Route registered for envelope delivery", speakerUri=speakerUri)
     
     async def unregister_route(self, speakerUri: str) -> None:
@@ -99,7 +174,9 @@ class FloorManager:
             speakerUri: Agent speaker URI
         """
         if speakerUri in self._routes:
-            del self._routes[speakerUri]
+            routes = dict(self._routes)
+            del routes[speakerUri]
+            self._routes = routes
             logger.info("Route unregistered", speakerUri=speakerUri)
     
     async def route_envelope(self, envelope: OpenFloorEnvelope) -> bool:
@@ -110,109 +187,218 @@ class FloorManager:
         - Privacy flag ONLY respected for utterance events
         - All other events ignore privacy flag
         
+        Recipients are resolved for all events first, then the envelope is
+        delivered to each recipient once, with all deliveries running
+        concurrently.
+        
         Args:
             envelope: Open Floor envelope to route
         
         Returns:
             True if routed successfully, False otherwise
         """
-        routed = False
+        return (await self.route_envelopes([envelope]))[0]
+    
+    async def route_envelopes(self, envelopes: List[OpenFloorEnvelope]) -> List[bool]:
+        """
+        Route a batch of envelopes
+        
+        Deliveries are grouped by recipient: each recipient gets one job that
+        receives its envelopes in batch order, and recipients are served
+        concurrently. While the Floor Manager is running, jobs go to a fixed
+        pool of workers (bounded queue gives backpressure); otherwise each
+        job runs in its own task.
+        
+        Args:
+            envelopes: Open Floor envelopes to route
+        
+        Returns:
+            Per-envelope flags, True if the envelope reached any recipient
+        """
+        # Routes are copy-on-write, so the current mapping is a stable snapshot
+        routes = self._routes
+        
+        # speakerUri -> (handler, indexes of envelopes to deliver)
+        batches: Dict[str, tuple[Callable, List[int]]] = {}
+        for index, envelope in enumerate(envelopes):
+            for speakerUri, handler in self._resolve_recipients(envelope, routes).items():
+                batches.setdefault(speakerUri, (handler, []))[1].append(index)
+        
+        routed = [False] * len(envelopes)
+        if not batches:
+            return routed
+        
+        pending: List[asyncio.Future] = []
+        if self._workers and not _IN_WORKER.get():
+            loop = asyncio.get_running_loop()
+            for speakerUri, (handler, indexes) in batches.items():
+                future = loop.create_future()
+                await self._queue.put((
+                    speakerUri,
+                    handler,
+                    [envelopes[index] for index in indexes],
+                    future
+                ))
+                pending.append(future)
+        else:
+            for speakerUri, (handler, indexes) in batches.items():
+                pending.append(_start_task(self._deliver_batch(
+                    speakerUri,
+                    handler,
+                    [envelopes[index] for index in indexes]
+                )))
+        
+        results = await asyncio.gather(*pending)
+        
+        for (_, indexes), delivered in zip(batches.values(), results):
+            for index, ok in zip(indexes, delivered):
+                if ok:
+                    routed[index] = True
+        
+        return routed
+    
+    def _resolve_recipients(
+        self,
+        envelope: OpenFloorEnvelope,
+        routes: Dict[str, Callable]
+    ) -> Dict[str, Callable]:
+        """
+        Resolve the handlers an envelope must be delivered to
+        
+        Each recipient appears once, even if several events target it.
+        """
+        deliveries: Dict[str, Callable] = {}
+        # Bound once: this loop runs for every event of every routed envelope
+        add = deliveries.setdefault
+        sender_uri = envelope.sender.speakerUri
+        privacy_events = self._PRIVACY_EVENTS
+        broadcast_done = False
         
         for event in envelope.events:
-            # OFP 1.1.0: Privacy flag only respected for utterance events
-            is_private = (
-                event.to is not None
-                and event.to.private
-                and event.eventType == EventType.UTTERANCE
-            )
+            to = event.to
             
             # If no 'to' section, event is for all recipients
-            if event.to is None:
+            if to is None:
+                if broadcast_done:
+                    continue
                 # Broadcast to all registered agents except sender
-                for speakerUri, handler in self._routes.items():
-                    if speakerUri == envelope.sender.speakerUri:
-                        continue
-                    try:
-                        await asyncio.wait_for(
-                            handler(envelope),
-                            timeout=self._timeout
-                        )
-                        routed = True
-                    except Exception as e:
-                        logger.error(
-                            "Routing error",
-                            speakerUri=speakerUri,
-                            error=str(e)
-                        )
+                for speakerUri, handler in routes.items():
+                    if speakerUri != sender_uri:
+                        add(speakerUri, handler)
+                broadcast_done = True
                 continue
             
             # Route to specific agent
-            target_speakerUri = event.to.speakerUri
+            target_speakerUri = to.speakerUri
             if not target_speakerUri:
                 logger.warning("Event has 'to' section but no speakerUri")
                 continue
             
-            # For private utterance events, only route to intended recipient
-            if is_private:
-                if target_speakerUri not in self._routes:
+            # OFP 1.1.0: Privacy flag only respected for utterance events.
+            # Private utterances and all other addressed events (privacy flag
+            # ignored) both go only to the intended recipient.
+            handler = routes.get(target_speakerUri)
+            if handler is None:
+                if to.private and event.eventType in privacy_events:
                     logger.warning(
                         "No route found for private event recipient",
                         speakerUri=target_speakerUri
                     )
-                    continue
-                
-                try:
-                    await asyncio.wait_for(
-                        self._routes[target_speakerUri](envelope),
-                        timeout=self._timeout
-                    )
-                    routed = True
-                    logger.debug(
-                        "Private utterance routed",
+                else:
+                    logger.warning(
+                        "No route found for agent",
                         speakerUri=target_speakerUri
                     )
-                except Exception as e:
-                    logger.error(
-                        "Private routing error",
-                        speakerUri=target_speakerUri,
-                        error=str(e)
-                    )
-                continue
-            
-            # For non-utterance events or non-private utterances:
-            # Privacy flag is ignored per OFP 1.1.0
-            # Route to intended recipient
-            if target_speakerUri not in self._routes:
-                logger.warning(
-                    "No route found for agent",
-                    speakerUri=target_speakerUri
-                )
                 continue
             
+            add(target_speakerUri, handler)
+        
+        return deliveries
+    
+    async def _deliver_batch(
+        self,
+        speakerUri: str,
+        handler: Callable[[OpenFloorEnvelope], None],
+        envelopes: List[OpenFloorEnvelope]
+    ) -> List[bool]:
+        """Deliver envelopes to one recipient in order"""
+        return [
+            await self._deliver(speakerUri, handler, envelope)
+            for envelope in envelopes
+        ]
+    
+    async def _deliver(
+        self,
+        speakerUri: str,
+        handler: Callable[[OpenFloorEnvelope], None],
+        envelope: OpenFloorEnvelope
+    ) -> bool:
+        """
+        Deliver an envelope to one recipient with the routing timeout applied
+        
+        Returns:
+            True if the handler completed, False on timeout or error (logged)
+        """
+        try:
+            # asyncio.timeout avoids the extra inner task asyncio.wait_for creates
+            async with asyncio.timeout(self._timeout):
+                await handler(envelope)
+        except asyncio.TimeoutError:
+            logger.error(
+                "Routing timeout",
+                speakerUri=speakerUri
+            )
+            return False
+        except Exception as e:
+            logger.error(
+                "Routing error",
+                speakerUri=speakerUri,
+                error=str(e)
+            )
+            return False
+        
+        if self._debug_enabled:
+            logger.debug(
+                "Envelope routed",
+                speakerUri=speakerUri
+            )
+        return True
+    
+    async def _worker(self) -> None:
+        """Routing worker: deliver queued jobs until cancelled"""
+        _IN_WORKER.set(True)
+        while True:
+            speakerUri, handler, envelopes, future = await self._queue.get()
             try:
-                await asyncio.wait_for(
-                    self._routes[target_speakerUri](envelope),
-                    timeout=self._timeout
-                )
-                routed = True
-                logger.debug(
-                    "Envelope routed",
-                    speakerUri=target_speakerUri,
-                    eventType=event.eventType
-                )
-            except asyncio.TimeoutError:
-                logger.error(
-                    "Routing timeout",
-                    speakerUri=target_speakerUri
-                )
+                # Skip jobs whose caller has already gone away
+                if not future.done():
+                    delivered = await self._deliver_batch(speakerUri, handler, envelopes)
+                    if not future.done():
+                        future.set_result(delivered)
+            except asyncio.CancelledError:
+                if not future.done():
+                    future.cancel()
+                raise
+            finally:
+                self._queue.task_done()
+    
+    async def _outbound_worker(self) -> None:
+        """Route envelopes queued by send_utterance(), batching bursts"""
+        while True:
+            envelopes = [await self._outbound.get()]
+            while not self._outbound.empty():
+                envelopes.append(self._outbound.get_nowait())
+            try:
+                await self.route_envelopes(envelopes)
             except Exception as e:
-                logger.error(
-                    "Routing error",
-                    speakerUri=target_speakerUri,
-                    error=str(e)
-                )
-        
-        return routed
+                logger.error("Outbound routing error", error=str(e))
+            finally:
+                for _ in envelopes:
+                    self._outbound.task_done()
+    
+    async def drain(self) -> None:
+        """Wait until all envelopes queued by send_utterance() are routed"""
+        await self._outbound.join()
     
     # =========================================================================
     # ENVELOPE PROCESSING (Floor Control Events)
@@ -256,41 +442,63 @@ class FloorManager:
         
         Per OFP 1.1.0: Floor Manager delegates floor decisions to Convener
         """
+        handler = self._event_handlers.get(event.eventType)
+        if handler:
+            await handler(envelope, event)
+        
+        # Other events are pass-through (routed but not specially processed)
+    
+    async def _handle_request_floor(
+        self,
+        envelope: OpenFloorEnvelope,
+        event: EventObject
+    ) -> None:
+        """Handle requestFloor event"""
         conversation_id = envelope.conversation.id
         sender_uri = envelope.sender.speakerUri
         
-        if event.eventType == EventType.REQUEST_FLOOR:
-            # Delegate to Convener (if present)
-            if self.convener:
-                priority = event.parameters.get("priority", 0) if event.parameters else 0
-                await self.convener.request_floor(
-                    conversation_id,
-                    sender_uri,
-                    priority
-                )
-            else:
-                # Minimal behavior: first-come-first-served
-                await self._minimal_floor_grant(conversation_id, sender_uri)
-        
-        elif event.eventType == EventType.YIELD_FLOOR:
-            # Delegate to Convener (if present)
-            if self.convener:
-                await self.convener.release_floor(conversation_id, sender_uri)
-            else:
-                # Minimal behavior: just release
-                logger.info("Floor released (minimal mode)", speakerUri=sender_uri)
-        
-        elif event.eventType == EventType.UTTERANCE:
-            # Just log utterance
-            logger.debug(
-                "Utterance received",
-                conversation_id=conversation_id,
-                speaker=sender_uri
-            )
+        if self._minimal:
+            # Minimal behavior: first-come-first-served
+            self._minimal_floor_grant(conversation_id, sender_uri)
+            return
         
-        # Other events are pass-through (routed but not specially processed)
+        # Delegate to Convener
+        await self.convener.request_floor(
+            conversation_id,
+            sender_uri,
+            event.request_floor_params.priority
+        )
+    
+    async def _handle_yield_floor(
+        self,
+        envelope: OpenFloorEnvelope,
+        event: EventObject
+    ) -> None:
+        """Handle yieldFloor event"""
+        sender_uri = envelope.sender.speakerUri
+        
+        if self._minimal:
+            # Minimal behavior: just release
+            logger.info("Floor released (minimal mode)", speakerUri=sender_uri)
+            return
+        
+        # Delegate to Convener
+        await self.convener.release_floor(envelope.conversation.id, sender_uri)
+    
+    async def _handle_utterance(
+        self,
+        envelope: OpenFloorEnvelope,
+        event: EventObject
+    ) -> None:
+        """Handle utterance event"""
+        # Just log utterance
+        logger.debug(
+            "Utterance received",
+            conversation_id=envelope.conversation.id,
+            speaker=envelope.sender.speakerUri
+        )
     
-    async def _minimal_floor_grant(self, conversation_id: str, speakerUri: str) -> None:
+    def _minimal_floor_grant(self, conversation_id: str, speakerUri: str) -> None:
         """
         Minimal floor grant behavior (when no convener present)
         
@@ -325,12 +533,9 @@ class FloorManager:
         Returns:
             Created envelope
         """
-        schema = SchemaObject(version="1.1.0")
-        conversation = ConversationObject(id=conversation_id)
-        sender = SenderObject(
-            speakerUri=sender_speakerUri,
-            serviceUrl=sender_serviceUrl
-        )
+        schema = _schema("1.1.0")
+        conversation = _conversation(conversation_id)
+        sender = _sender(sender_speakerUri, sender_serviceUrl)
         
         return OpenFloorEnvelope(
             schema_obj=schema,
@@ -352,6 +557,10 @@ class FloorManager:
         """
         Send an utterance event
         
+        While the Floor Manager is running the envelope is queued and routed
+        in the background (see drain()); otherwise it is routed before
+        returning.
+        
         Args:
             conversation_id: Conversation identifier
             sender_speakerUri: Sender speaker URI
@@ -366,13 +575,11 @@ class FloorManager:
         """
         to_obj = None
         if target_speakerUri:
-            to_obj = ToObject(
-                speakerUri=target_speakerUri,
-                serviceUrl=target_serviceUrl,
-                private=private
-            )
+            to_obj = _to(target_speakerUri, target_serviceUrl, private)
         
-        event = EventObject(
+        # Every field below is built here with the right type, so the
+        # utterance envelope skips pydantic validation (model_construct)
+        event = EventObject.model_construct(
             to=to_obj,
             eventType=EventType.UTTERANCE,
             parameters={
@@ -388,14 +595,17 @@ class FloorManager:
             }
         )
         
-        envelope = await self.create_envelope(
-            conversation_id=conversation_id,
-            sender_speakerUri=sender_speakerUri,
-            sender_serviceUrl=sender_serviceUrl,
+        envelope = OpenFloorEnvelope.model_construct(
+            schema_obj=_schema("1.1.0"),
+            conversation=_conversation(conversation_id),
+            sender=_sender(sender_speakerUri, sender_serviceUrl),
             events=[event]
         )
         
-        await self.route_envelope(envelope)
+        if self._outbound_worker_task is not None:
+            await self._outbound.put(envelope)
+        else:
+            await self.route_envelope(envelope)
         return envelope
     
     # =========================================================================
@@ -404,11 +614,47 @@ class FloorManager:
     
     async def start(self) -> None:
         """Start Floor Manager"""
+        if self._running:
+            return
+        
         self._running = True
-        logger.info("Floor Manager started")
+        self._debug_enabled = logger.is_enabled_for(logging.DEBUG)
+        self._workers = [
+            asyncio.create_task(self._worker())
+            for _ in range(self._num_workers)
+        ]
+        self._outbound_worker_task = asyncio.create_task(self._outbound_worker())
+        logger.info("Floor Manager started", workers=self._num_workers)
     
     async def stop(self) -> None:
         """Stop Floor Manager"""
+        if not self._running:
+            return
+        
         self._running = False
+        
+        # Route what senders already queued, then stop accepting
+        await self.drain()
+        outbound_worker, self._outbound_worker_task = self._outbound_worker_task, None
+        outbound_worker.cancel()
+        await asyncio.gather(outbound_worker, return_exceptions=True)
+        
+        workers, self._workers = self._workers, []
+        for worker in workers:
+            worker.cancel()
+        await asyncio.gather(*workers, return_exceptions=True)
+        
+        # Fail jobs that were queued but never picked up
+        while not self._queue.empty():
+            speakerUri, _, envelopes, future = self._queue.get_nowait()
+            if not future.done():
+                logger.error(
+                    "Routing error",
+                    speakerUri=speakerUri,
+                    error="Floor Manager stopped"
+                )
+                future.set_result([False] * len(envelopes))
+            self._queue.task_done()
+        
         logger.info("Floor Manager stopped")
 
@@ -6,6 +6,12 @@ from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 import structlog
 import logging
+import asyncio
+import atexit
+import sys
+import threading
+from functools import lru_cache
+from typing import Callable, List, Optional, TextIO
 
 from src.config import settings
 from src.api import floor_router, envelope_router
@@ -21,61 +27,125 @@ LOG_LEVEL_MAP = {
 }
 log_level = LOG_LEVEL_MAP.get(settings.LOG_LEVEL.upper(), logging.INFO)
 
-# Configure structured logging
-structlog.configure(
-    processors=[
-        structlog.processors.TimeStamper(fmt="iso"),
-        structlog.processors.add_log_level,
-        structlog.processors.JSONRenderer()
-    ],
-    wrapper_class=structlog.make_filtering_bound_logger(log_level),
-    context_class=dict,
-    logger_factory=structlog.PrintLoggerFactory(),
-    cache_logger_on_first_use=False,
-)
+
+class BatchedLogStream:
+    """
+    Log output stream that coalesces writes
+    
+    structlog's loggers flush after every line; here flush() is deferred and the
+    buffered lines are written in one call by drain(), which runs shortly
+    after the first buffered line (see startup_event) or once max_pending
+    lines accumulate.
+    
+    write() and drain() may be called from any thread (threadpool-run
+    endpoints, atexit), so the buffer is only touched under a lock.
+    """
+    
+    def __init__(self, stream: TextIO, max_pending: int = 1024) -> None:
+        self._stream = stream
+        self._max_pending = max_pending
+        self._pending: List[str] = []
+        self._lock = threading.Lock()
+        # Held across swap and write so concurrent drains keep line order
+        self._drain_lock = threading.Lock()
+        # Called (from the writing thread) when a line lands in an empty buffer
+        self.on_pending: Optional[Callable[[], None]] = None
+    
+    def write(self, data: str) -> int:
+        with self._lock:
+            self._pending.append(data)
+            count = len(self._pending)
+        if count >= self._max_pending:
+            self.drain()
+        elif count == 1 and self.on_pending is not None:
+            self.on_pending()
+        return len(data)
+    
+    def flush(self) -> None:
+        # Deferred to drain()
+        pass
+    
+    def drain(self) -> None:
+        """Write and flush all buffered log output"""
+        with self._drain_lock:
+            with self._lock:
+                if not self._pending:
+                    return
+                pending, self._pending = self._pending, []
+            self._stream.write("".join(pending))
+            self._stream.flush()
+
+
+log_stream = BatchedLogStream(sys.stdout)
+atexit.register(log_stream.drain)
+
+
+@lru_cache(maxsize=1)
+def configure_logging() -> None:
+    """Configure structured logging (once per process)"""
+    structlog.configure(
+        processors=[
+            structlog.processors.TimeStamper(fmt="iso"),
+            structlog.processors.add_log_level,
+            structlog.processors.JSONRenderer()
+        ],
+        wrapper_class=structlog.make_filtering_bound_logger(log_level),
+        context_class=dict,
+        # WriteLogger: one write() per line, no print() machinery
+        logger_factory=structlog.WriteLoggerFactory(file=log_stream),
+        cache_logger_on_first_use=False,
+    )
+
 
 logger = structlog.get_logger()
 
-app = FastAPI(
-    title=settings.APP_NAME,
-    version=settings.APP_VERSION,
-    description="Open Floor Protocol 1.1 Multi-Agent System",
-    docs_url="/docs",
-    redoc_url="/redoc",
-)
-
-# CORS middleware
-app.add_middleware(
-    CORSMiddleware,
-    allow_origins=settings.CORS_ORIGINS,
-    allow_credentials=settings.CORS_CREDENTIALS,
-    allow_methods=["*"],
-    allow_headers=["*"],
-)
-
-# Include API routers
-app.include_router(floor_router)
-app.include_router(envelope_router)
-# Note: Agent registry removed - not part of OFP 1.1 specification
-
-# Add real-time endpoints (SSE and WebSocket)
-create_sse_endpoint(floor_router)  # SSE endpoint for one-way updates
-create_websocket_endpoint(app)  # WebSocket endpoint for bidirectional updates
-
-
-@app.on_event("startup")
+_log_flush_task: Optional[asyncio.Task] = None
+
+
+async def _flush_logs_when_pending(pending: asyncio.Event) -> None:
+    """
+    Drain batched log output LOG_FLUSH_INTERVAL seconds after the first new line
+    
+    Sleeps on the event while no log output is buffered, so an idle process
+    is not woken up.
+    """
+    while True:
+        await pending.wait()
+        pending.clear()
+        # Let lines logged in the meantime join this write
+        await asyncio.sleep(settings.LOG_FLUSH_INTERVAL)
+        log_stream.drain()
+
+
 async def startup_event() -> None:
     """Initialize services on startup"""
+    global _log_flush_task
+    loop = asyncio.get_running_loop()
+    pending = asyncio.Event()
+    
+    def wake_flusher() -> None:
+        try:
+            loop.call_soon_threadsafe(pending.set)
+        except RuntimeError:
+            # Loop already closed; atexit drains what is left
+            pass
+    
+    log_stream.on_pending = wake_flusher
+    _log_flush_task = asyncio.create_task(_flush_logs_when_pending(pending))
+    # Lines buffered before startup
+    pending.set()
     logger.info("Starting Open Floor Protocol API", version=settings.APP_VERSION)
 
 
-@app.on_event("shutdown")
 async def shutdown_event() -> None:
     """Cleanup on shutdown"""
     logger.info("Shutting down Open Floor Protocol API")
+    log_stream.on_pending = None
+    if _log_flush_task is not None:
+        _log_flush_task.cancel()
+    log_stream.drain()
 
 
-@app.get("/")
 async def root() -> dict:
     """Root endpoint"""
     return {
@@ -85,8 +155,55 @@ async def root() -> dict:
     }
 
 
-@app.get("/health")
 async def health_check() -> dict:
     """Health check endpoint"""
     return {"status": "healthy"}
 
+
+@lru_cache(maxsize=1)
+def create_app() -> FastAPI:
+    """
+    Build the FastAPI application
+    
+    Cached, so the app (middleware stack, routers, real-time endpoints) is
+    built once per process; also usable as
+    `uvicorn --factory src.main:create_app`.
+    """
+    configure_logging()
+    
+    app = FastAPI(
+        title=settings.APP_NAME,
+        version=settings.APP_VERSION,
+        description="Open Floor Protocol 1.1 Multi-Agent System",
+        docs_url="/docs",
+        redoc_url="/redoc",
+    )
+    
+    # CORS middleware
+    app.add_middleware(
+        CORSMiddleware,
+        allow_origins=settings.CORS_ORIGINS,
+        allow_credentials=settings.CORS_CREDENTIALS,
+        allow_methods=["*"],
+        allow_headers=["*"],
+    )
+    
+    # Add real-time endpoints (SSE and WebSocket); the SSE route must be on
+    # floor_router before it is included, include_router copies routes
+    create_sse_endpoint(floor_router)  # SSE endpoint for one-way updates
+    create_websocket_endpoint(app)  # WebSocket endpoint for bidirectional updates
+    
+    # Include API routers
+    app.include_router(floor_router)
+    app.include_router(envelope_router)
+    # Note: Agent registry removed - not part of OFP 1.1 specification
+    
+    app.on_event("startup")(startup_event)
+    app.on_event("shutdown")(shutdown_event)
+    app.get("/")(root)
+    app.get("/health")(health_check)
+    
+    return app
+
+
+app = create_app()
@@ -6,6 +6,7 @@ floor manager that only arbitrates conflicts. Supports emergent behavior and
 self-organization of agents.
 """
 
+from operator import itemgetter
 from typing import Optional
 import structlog
 
@@ -14,6 +15,8 @@ from src.floor_manager.envelope import EventType
 
 logger = structlog.get_logger()
 
+_PRIORITY = itemgetter(1)
+
 
 class CollaborativeOrchestrator:
     """
@@ -119,9 +122,8 @@ class CollaborativeOrchestrator:
         if not requesters:
             return None;
 
-        # Sort by priority (higher first)
-        sorted_requesters = sorted(requesters, key=lambda x: -x[1]);
-        winner = sorted_requesters[0][0];
+        # Highest priority wins (first requester on ties)
+        winner = max(requesters, key=_PRIORITY)[0];
 
         logger.info(
             "Floor conflict arbitrated",
@@ -13,8 +13,15 @@ Agent explicitly manages conversation flow using strategies like round-robin,
 priority-based, or context-aware turn-taking.
 """
 
-from typing import List, Optional, Dict
+from abc import ABC, abstractmethod
+from collections import deque
+from dataclasses import dataclass
+from typing import Deque, List, Optional, Dict
 from enum import Enum
+import asyncio
+import heapq
+import logging
+import itertools
 import structlog
 
 from src.floor_manager.floor_control import FloorControl
@@ -36,13 +43,38 @@ class ConvenerStrategy(str, Enum):
     CONTEXT_AWARE = "context_aware"
 
 
-class ConvenerOrchestrator:
+@dataclass(slots=True)
+class _Participant:
+    """Invited participant state"""
+    priority: int
+    invited: bool = True
+    # Muted participants stay invited but are skipped by grants
+    active: bool = True
+    # Sequence number of the participant's current priority heap entry;
+    # any other entry for the same URI is stale
+    seq: int = -1
+
+
+class ConvenerOrchestrator(ABC):
     """
     Convener-Based Orchestration per OFP 1.0.0
     
     A convener agent manages the floor explicitly, coordinating multi-agent conversations
+
+    Constructing a ConvenerOrchestrator returns the subclass specialized for
+    the given strategy, which only carries the state that strategy needs.
     """
 
+    def __new__(
+        cls,
+        convener_speakerUri: str,
+        floor_control: FloorControl,
+        strategy: ConvenerStrategy = ConvenerStrategy.ROUND_ROBIN
+    ) -> "ConvenerOrchestrator":
+        if cls is ConvenerOrchestrator:
+            cls = _STRATEGY_CLASSES[ConvenerStrategy(strategy)];
+        return super().__new__(cls)
+
     def __init__(
         self,
         convener_speakerUri: str,
@@ -55,17 +87,24 @@ class ConvenerOrchestrator:
         Args:
             convener_speakerUri: Speaker URI of the convener agent
             floor_control: Floor control instance
-            strategy: Orchestration strategy
+            strategy: Orchestration strategy (enum member or its string value)
         
         Note: No agent registry needed per OFP 1.0.1 - agents are identified
               only by their speakerUri in envelopes.
         """
         self.convener_speakerUri = convener_speakerUri;
         self.floor_control = floor_control;
+        strategy = ConvenerStrategy(strategy);
         self.strategy = strategy;
-        self._participants: Dict[str, dict] = {};
-        self._turn_order: List[str] = [];
-        self._current_turn_index = 0
+        # Per-orchestrator context bound once instead of passed on every call
+        self._log = logger.bind(
+            convener=convener_speakerUri,
+            strategy=strategy.value
+        );
+        self._info_enabled = self._log.is_enabled_for(logging.INFO);
+        self._participants: Dict[str, _Participant] = {};
+        # conversation_id -> speakerUri of this convener's last grant
+        self._last_granted: Dict[str, str] = {}
 
     async def invite_participant(
         self,
@@ -88,19 +127,23 @@ class ConvenerOrchestrator:
               by their speakerUri when they send envelopes.
         """
         # No registry lookup needed - just track the participant
-        self._participants[participant_speakerUri] = {
-            "priority": priority,
-            "invited": True
-        };
-
-        if self.strategy == ConvenerStrategy.ROUND_ROBIN:
-            self._turn_order.append(participant_speakerUri);
-
-        logger.info(
-            "Participant invited",
-            conversation_id=conversation_id,
-            participant=participant_speakerUri
-        );
+        # _enqueue supersedes any earlier selection entry for the URI (also
+        # one left over from before an uninvite), so only one entry counts
+        participant = self._participants.get(participant_speakerUri);
+        if participant is None:
+            self._participants[participant_speakerUri] = _Participant(priority);
+            self._enqueue(participant_speakerUri, priority);
+        elif participant.priority != priority:
+            # Re-invite: update in place, keeping e.g. the muted state
+            participant.priority = priority;
+            self._enqueue(participant_speakerUri, priority);
+
+        if self._info_enabled:
+            self._log.info(
+                "Participant invited",
+                conversation_id=conversation_id,
+                participant=participant_speakerUri
+            );
 
         return True
 
@@ -120,46 +163,70 @@ class ConvenerOrchestrator:
         if not self._participants:
             return None;
 
-        if self.strategy == ConvenerStrategy.ROUND_ROBIN:
-            if not self._turn_order:
-                return None;
+        next_speakerUri = self._pick_next();
+        if next_speakerUri is None:
+            return None;
 
-            next_speakerUri = self._turn_order[
-                self._current_turn_index % len(self._turn_order)
-            ];
-            self._current_turn_index += 1;
-
-        elif self.strategy == ConvenerStrategy.PRIORITY_BASED:
-            # Sort by priority (higher first)
-            sorted_participants = sorted(
-                self._participants.items(),
-                key=lambda x: -x[1]["priority"]
-            );
-            next_speakerUri = sorted_participants[0][0];
-
-        else:  # CONTEXT_AWARE - same as priority for now
-            sorted_participants = sorted(
-                self._participants.items(),
-                key=lambda x: -x[1]["priority"]
-            );
-            next_speakerUri = sorted_participants[0][0];
+        # Already holding it (e.g. sole participant): re-requesting would
+        # only queue the holder behind itself
+        if (
+            self._last_granted.get(conversation_id) == next_speakerUri
+            and await self.floor_control.get_floor_holder(conversation_id) == next_speakerUri
+        ):
+            return next_speakerUri;
 
         # Grant floor
         await self.floor_control.request_floor(
             conversation_id,
             next_speakerUri,
-            priority=self._participants[next_speakerUri]["priority"]
+            priority=self._participants[next_speakerUri].priority
         );
+        self._last_granted[conversation_id] = next_speakerUri;
 
-        logger.info(
-            "Floor granted by convener",
-            conversation_id=conversation_id,
-            speakerUri=next_speakerUri,
-            strategy=self.strategy
-        );
+        if self._info_enabled:
+            self._log.info(
+                "Floor granted by convener",
+                conversation_id=conversation_id,
+                speakerUri=next_speakerUri
+            );
 
         return next_speakerUri
 
+    @abstractmethod
+    def _enqueue(self, speakerUri: str, priority: int) -> None:
+        """Add an invited participant to the strategy's selection order"""
+        pass
+
+    @abstractmethod
+    def _pick_next(self) -> Optional[str]:
+        """Select the next speaker according to the strategy"""
+        pass
+
+    async def set_active(
+        self,
+        participant_speakerUri: str,
+        active: bool
+    ) -> bool:
+        """
+        Mute or unmute a participant without uninviting them
+
+        Muted participants keep their turn order and priority but are
+        skipped when granting the floor.
+
+        Args:
+            participant_speakerUri: Participant speaker URI
+            active: False to mute, True to unmute
+
+        Returns:
+            True if the participant exists
+        """
+        participant = self._participants.get(participant_speakerUri);
+        if participant is None:
+            return False;
+
+        participant.active = active;
+        return True
+
     async def revoke_floor(
         self,
         conversation_id: str,
@@ -177,20 +244,21 @@ class ConvenerOrchestrator:
         Returns:
             True if revoked successfully
         """
-        # Check if agent has floor
-        holder = await self.floor_control.get_floor_holder(conversation_id);
-        if holder != speakerUri:
+        # Release floor if agent holds it (will trigger queue processing);
+        # release_floor checks the holder itself, so no separate lookup
+        if not await self.floor_control.release_floor(conversation_id, speakerUri):
             return False;
 
-        # Release floor (will trigger queue processing)
-        await self.floor_control.release_floor(conversation_id, speakerUri);
+        if self._last_granted.get(conversation_id) == speakerUri:
+            del self._last_granted[conversation_id];
 
-        logger.info(
-            "Floor revoked by convener",
-            conversation_id=conversation_id,
-            speakerUri=speakerUri,
-            reason=reason
-        );
+        if self._info_enabled:
+            self._log.info(
+                "Floor revoked by convener",
+                conversation_id=conversation_id,
+                speakerUri=speakerUri,
+                reason=reason
+            );
 
         return True
 
@@ -215,18 +283,160 @@ class ConvenerOrchestrator:
         # Revoke floor if they have it
         await self.revoke_floor(conversation_id, participant_speakerUri, "@uninvite");
 
-        # Remove from participants
+        # Remove from participants (turn order and priority heap entries
+        # are dropped lazily on the next grant)
         del self._participants[participant_speakerUri];
 
-        # Remove from turn order
-        if participant_speakerUri in self._turn_order:
-            self._turn_order.remove(participant_speakerUri);
-
-        logger.info(
-            "Participant uninvited",
-            conversation_id=conversation_id,
-            participant=participant_speakerUri
-        );
+        if self._info_enabled:
+            self._log.info(
+                "Participant uninvited",
+                conversation_id=conversation_id,
+                participant=participant_speakerUri
+            );
 
         return True
 
+    async def uninvite_participants(
+        self,
+        conversation_id: str,
+        participant_speakerUris: List[str]
+    ) -> int:
+        """
+        Remove several participants from conversation
+
+        Floor revocations run concurrently; local cleanup happens after.
+
+        Args:
+            conversation_id: Conversation identifier
+            participant_speakerUris: Participant speaker URIs
+
+        Returns:
+            Number of participants removed
+        """
+        uninvited = [
+            speakerUri for speakerUri in dict.fromkeys(participant_speakerUris)
+            if speakerUri in self._participants
+        ];
+
+        # Revoke floor from whichever of them holds it
+        await asyncio.gather(*(
+            self.revoke_floor(conversation_id, speakerUri, "@uninvite")
+            for speakerUri in uninvited
+        ));
+
+        for speakerUri in uninvited:
+            self._participants.pop(speakerUri, None);
+
+        if self._info_enabled:
+            self._log.info(
+                "Participants uninvited",
+                conversation_id=conversation_id,
+                participants=uninvited
+            );
+
+        return len(uninvited)
+
+
+class _RoundRobinConvener(ConvenerOrchestrator):
+    """Convener taking turns in invite order"""
+
+    def __init__(
+        self,
+        convener_speakerUri: str,
+        floor_control: FloorControl,
+        strategy: ConvenerStrategy = ConvenerStrategy.ROUND_ROBIN
+    ) -> None:
+        super().__init__(convener_speakerUri, floor_control, strategy);
+        # Round-robin order; the next speaker is always at the front.
+        # Uninvited participants stay in it until skipped by a grant, so
+        # _turn_order_set tracks which URIs are physically in the deque
+        self._turn_order: Deque[str] = deque();
+        self._turn_order_set: set[str] = set()
+
+    def _enqueue(self, speakerUri: str, priority: int) -> None:
+        if speakerUri not in self._turn_order_set:
+            self._turn_order.append(speakerUri);
+            self._turn_order_set.add(speakerUri);
+
+    def _pick_next(self) -> Optional[str]:
+        """Take the next round-robin speaker, dropping uninvited participants"""
+        turn_order = self._turn_order;
+        for _ in range(len(turn_order)):
+            speakerUri = turn_order[0];
+            participant = self._participants.get(speakerUri);
+            if participant is None:
+                turn_order.popleft();
+                self._turn_order_set.discard(speakerUri);
+                continue;
+            turn_order.rotate(-1);
+            if participant.active:
+                return speakerUri;
+        return None
+
+
+class _PriorityConvener(ConvenerOrchestrator):
+    """Convener granting the highest-priority participant"""
+
+    def __init__(
+        self,
+        convener_speakerUri: str,
+        floor_control: FloorControl,
+        strategy: ConvenerStrategy = ConvenerStrategy.PRIORITY_BASED
+    ) -> None:
+        super().__init__(convener_speakerUri, floor_control, strategy);
+        # Max-heap of (-priority, seq, speakerUri); entries of
+        # uninvited/re-prioritized participants are dropped lazily
+        self._priority_heap: List[tuple[int, int, str]] = [];
+        self._heap_seq = itertools.count()
+
+    def _enqueue(self, speakerUri: str, priority: int) -> None:
+        seq = next(self._heap_seq);
+        self._participants[speakerUri].seq = seq;
+        heapq.heappush(self._priority_heap, (-priority, seq, speakerUri));
+        self._compact_heap();
+
+    def _is_current(self, entry: tuple[int, int, str]) -> bool:
+        """Whether a heap entry is the current one of an invited participant"""
+        participant = self._participants.get(entry[2]);
+        return participant is not None and participant.seq == entry[1]
+
+    def _compact_heap(self) -> None:
+        """Rebuild the heap once stale entries make up more than half of it"""
+        # Every participant has exactly one current entry
+        heap = self._priority_heap;
+        if len(heap) > 2 * len(self._participants):
+            heap[:] = [entry for entry in heap if self._is_current(entry)];
+            heapq.heapify(heap);
+
+    def _pick_next(self) -> Optional[str]:
+        """Return the highest-priority participant, dropping stale heap entries"""
+        # Highest priority (earliest invited on ties) is the heap top;
+        # muted participants are set aside and pushed back afterwards
+        heap = self._priority_heap;
+        muted = [];
+        next_speakerUri = None;
+        while heap:
+            entry = heap[0];
+            if not self._is_current(entry):
+                heapq.heappop(heap);
+            elif not self._participants[entry[2]].active:
+                muted.append(heapq.heappop(heap));
+            else:
+                next_speakerUri = entry[2];
+                break;
+
+        for entry in muted:
+            heapq.heappush(heap, entry);
+        self._compact_heap();
+        return next_speakerUri
+
+
+class _ContextAwareConvener(_PriorityConvener):
+    """Convener selecting by conversation context (same as priority for now)"""
+
+
+_STRATEGY_CLASSES: Dict[ConvenerStrategy, type] = {
+    ConvenerStrategy.ROUND_ROBIN: _RoundRobinConvener,
+    ConvenerStrategy.PRIORITY_BASED: _PriorityConvener,
+    ConvenerStrategy.CONTEXT_AWARE: _ContextAwareConvener
+}
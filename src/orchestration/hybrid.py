@@ -9,7 +9,11 @@ NOTE: Per OFP 1.0.1, no agent registry exists. Agents are identified only
       by their speakerUri in envelopes.
 """
 
+from itertools import chain
 from typing import Optional, Dict, List
+import asyncio
+import logging
+import sys
 import structlog
 
 from src.floor_manager.floor_control import FloorControl
@@ -43,7 +47,13 @@ class HybridOrchestrator:
         """
         self.master_speakerUri = master_speakerUri;
         self.floor_control = floor_control;
-        self._delegations: Dict[str, dict] = {}  # conversation_id -> delegation info
+        # Per-orchestrator context bound once instead of passed on every call
+        self._log = logger.bind(master=master_speakerUri);
+        self._info_enabled = self._log.is_enabled_for(logging.INFO);
+        self._delegations: Dict[str, dict] = {};  # conversation_id -> delegation info
+        # main_conversation_id -> {sub_conversation_id: view} (active only);
+        # views are built once, active delegations never change
+        self._active_by_main: Dict[str, Dict[str, dict]] = {}
 
     async def delegate_to_specialist(
         self,
@@ -62,8 +72,11 @@ class HybridOrchestrator:
         Returns:
             Sub-conversation identifier
         """
-        # Create sub-conversation ID
-        sub_conversation_id = f"{main_conversation_id}_sub_{specialist_speakerUri}";
+        # Create sub-conversation ID (interned: it keys several dicts and is
+        # handed back by callers to recall/merge)
+        sub_conversation_id = sys.intern(
+            f"{main_conversation_id}_sub_{specialist_speakerUri}"
+        );
 
         # Grant floor to specialist in sub-conversation
         await self.floor_control.request_floor(
@@ -73,19 +86,23 @@ class HybridOrchestrator:
         );
 
         # Track delegation
-        self._delegations[sub_conversation_id] = {
+        delegation = {
+            "sub_conversation_id": sub_conversation_id,
             "main_conversation_id": main_conversation_id,
             "specialist_speakerUri": specialist_speakerUri,
             "task_description": sub_task_description,
             "status": "active"
         };
+        self._delegations[sub_conversation_id] = delegation;
+        self._active_by_main.setdefault(main_conversation_id, {})[sub_conversation_id] = dict(delegation);
 
-        logger.info(
-            "Task delegated to specialist",
-            main_conversation_id=main_conversation_id,
-            sub_conversation_id=sub_conversation_id,
-            specialist=specialist_speakerUri
-        );
+        if self._info_enabled:
+            self._log.info(
+                "Task delegated to specialist",
+                main_conversation_id=main_conversation_id,
+                sub_conversation_id=sub_conversation_id,
+                specialist=specialist_speakerUri
+            );
 
         return sub_conversation_id
 
@@ -116,15 +133,59 @@ class HybridOrchestrator:
 
         # Update delegation status
         delegation["status"] = "recalled";
+        self._deactivate(sub_conversation_id, delegation);
 
-        logger.info(
-            "Delegation recalled",
-            sub_conversation_id=sub_conversation_id,
-            specialist=specialist_speakerUri
-        );
+        if self._info_enabled:
+            self._log.info(
+                "Delegation recalled",
+                sub_conversation_id=sub_conversation_id,
+                specialist=specialist_speakerUri
+            );
 
         return True
 
+    async def recall_all_delegations(
+        self,
+        main_conversation_id: str
+    ) -> int:
+        """
+        Recall every active delegation of a main conversation
+
+        Floor releases run concurrently; statuses are updated after.
+
+        Args:
+            main_conversation_id: Main conversation identifier
+
+        Returns:
+            Number of delegations recalled
+        """
+        active = list(self._active_by_main.get(main_conversation_id, {}));
+        if not active:
+            return 0;
+
+        # Revoke floor from all specialists
+        await asyncio.gather(*(
+            self.floor_control.release_floor(
+                sub_conversation_id,
+                self._delegations[sub_conversation_id]["specialist_speakerUri"]
+            )
+            for sub_conversation_id in active
+        ));
+
+        for sub_conversation_id in active:
+            delegation = self._delegations[sub_conversation_id];
+            delegation["status"] = "recalled";
+            self._deactivate(sub_conversation_id, delegation);
+
+        if self._info_enabled:
+            self._log.info(
+                "Delegations recalled",
+                main_conversation_id=main_conversation_id,
+                count=len(active)
+            );
+
+        return len(active)
+
     async def merge_sub_conversation(
         self,
         sub_conversation_id: str,
@@ -146,12 +207,14 @@ class HybridOrchestrator:
         delegation = self._delegations[sub_conversation_id];
         delegation["result"] = result;
         delegation["status"] = "completed";
+        self._deactivate(sub_conversation_id, delegation);
 
-        logger.info(
-            "Sub-conversation merged",
-            sub_conversation_id=sub_conversation_id,
-            main_conversation_id=delegation["main_conversation_id"]
-        );
+        if self._info_enabled:
+            self._log.info(
+                "Sub-conversation merged",
+                sub_conversation_id=sub_conversation_id,
+                main_conversation_id=delegation["main_conversation_id"]
+            );
 
         return True
 
@@ -166,19 +229,22 @@ class HybridOrchestrator:
             main_conversation_id: Optional filter by main conversation
 
         Returns:
-            List of active delegations
+            List of active delegations (shared views, treat as read-only)
         """
-        delegations = [];
-        for sub_id, delegation in self._delegations.items():
-            if (
-                delegation["status"] == "active"
-                and (main_conversation_id is None
-                     or delegation["main_conversation_id"] == main_conversation_id)
-            ):
-                delegations.append({
-                    "sub_conversation_id": sub_id,
-                    **delegation
-                });
-
-        return delegations
-
+        if main_conversation_id is not None:
+            # Sized list built in one C-level copy
+            return list(self._active_by_main.get(main_conversation_id, {}).values());
+
+        return list(chain.from_iterable(
+            by_sub.values() for by_sub in self._active_by_main.values()
+        ))
+
+    def _deactivate(self, sub_conversation_id: str, delegation: dict) -> None:
+        """Drop a delegation from the active index"""
+        main_conversation_id = delegation["main_conversation_id"];
+        by_sub = self._active_by_main.get(main_conversation_id);
+        if by_sub is None or by_sub.pop(sub_conversation_id, None) is None:
+            return;
+
+        if not by_sub:
+            del self._active_by_main[main_conversation_id]
@@ -7,13 +7,282 @@ Run: streamlit run streamlit_app.py
 
 import streamlit as st
 import asyncio
+import hashlib
 import httpx
 import os
+import sys
+import threading
+import time
+import traceback
+from collections import deque
+from dataclasses import dataclass
 from datetime import datetime
 
+sys.path.insert(0, os.path.dirname(__file__))
+from src.agents.llm_agent import LLMAgent
+
 # Configuration
 FLOOR_API = "http://localhost:8787/api/v1"
 CONVERSATION_ID = "streamlit_chat_001"
+DEMO_MAX_FLOOR_CHECKS = 15
+MAX_CHAT_MESSAGES = 50
+HOLDER_TRUST_SECONDS = 2.0
+
+
+@st.cache_resource
+def get_http_client() -> httpx.Client:
+    """Shared Floor Manager client, kept across reruns to reuse keep-alive connections"""
+    return httpx.Client(
+        base_url=FLOOR_API,
+        http2=True,
+        limits=httpx.Limits(max_keepalive_connections=20, max_connections=100),
+        timeout=httpx.Timeout(5.0, connect=0.5)
+    )
+
+
+@st.cache_resource
+def get_loop() -> asyncio.AbstractEventLoop:
+    """
+    Background event loop shared across reruns
+
+    The cached agents' async LLM clients stay bound to this one loop, so their
+    connection pools remain usable from turn to turn.
+    """
+    loop = asyncio.new_event_loop()
+    threading.Thread(target=loop.run_forever, daemon=True).start()
+    return loop
+
+
+def run_async(coro):
+    """Run a coroutine on the background loop and wait for its result"""
+    return asyncio.run_coroutine_threadsafe(coro, get_loop()).result()
+
+
+def iter_async(agen):
+    """
+    Iterate an async generator from the script thread, one item per round trip to the loop
+
+    The generator is closed even if iteration stops early (exception or
+    rerun), so e.g. an LLM stream does not keep its connection open.
+    """
+    try:
+        while True:
+            try:
+                yield run_async(agen.__anext__())
+            except StopAsyncIteration:
+                return
+    finally:
+        run_async(agen.aclose())
+
+
+@st.cache_resource(show_spinner=False)
+def get_openai_client(api_key: str):
+    """One pooled AsyncOpenAI client per API key, shared by every demo agent"""
+    from openai import AsyncOpenAI
+    return AsyncOpenAI(
+        api_key=api_key,
+        http_client=httpx.AsyncClient(limits=httpx.Limits(max_keepalive_connections=20))
+    )
+
+
+def get_llm_agent(
+    speakerUri: str,
+    agent_name: str,
+    model_name: str,
+    system_prompt: str,
+    api_key: str
+) -> LLMAgent:
+    """
+    Build each demo agent once per session and reuse it across reruns
+
+    Kept in session state rather than st.cache_resource: the agent's
+    conversation history must not be shared between browser sessions. The
+    pooled OpenAI client is still shared process-wide; the agent is rebuilt
+    when the API key (and so the client) changes.
+    """
+    client = get_openai_client(api_key)
+    agents = st.session_state.setdefault("llm_agents", {})
+    cached = agents.get(speakerUri)
+    if cached is None or cached[0] is not client:
+        cached = agents[speakerUri] = (client, LLMAgent(
+            speakerUri=speakerUri,
+            agent_name=agent_name,
+            llm_provider="openai",
+            model_name=model_name,
+            system_prompt=system_prompt,
+            client=client
+        ))
+    return cached[1]
+
+
+def grant_floor(client, speakerUri: str, priority: int):
+    """
+    Request the floor for speakerUri
+
+    Works with both the pooled httpx.Client and an httpx.AsyncClient; with
+    the latter the returned value must be awaited.
+    """
+    return client.post(
+        "/floor/request",
+        json={"conversation_id": CONVERSATION_ID, "speakerUri": speakerUri, "priority": priority}
+    )
+
+
+def release_floor(client, speakerUri: str):
+    """Release the floor held by speakerUri (awaitable with an httpx.AsyncClient)"""
+    return client.post(
+        "/floor/release",
+        json={"conversation_id": CONVERSATION_ID, "speakerUri": speakerUri}
+    )
+
+
+@dataclass(slots=True)
+class ChatMsg:
+    """One chat transcript row"""
+    role: str
+    name: str
+    content: str
+    avatar: str
+    timestamp: str
+
+
+@st.cache_data(ttl=1.0, show_spinner=False)
+def fetch_floor_holder(conversation_id: str) -> dict | None:
+    """Current floor holder payload, or None if the Floor Manager is unreachable"""
+    try:
+        response = get_http_client().get(f"/floor/holder/{conversation_id}")
+        response.raise_for_status()
+        return response.json()
+    except (httpx.HTTPError, ValueError):
+        return None
+
+
+@st.cache_data(ttl=3600, show_spinner=False)
+def cached_llm_response(
+    _agent: LLMAgent,
+    _generated: list,
+    api_key_hash: str,
+    agent_name: str,
+    model: str,
+    system_prompt: str,
+    prompt: str
+) -> str:
+    """
+    Demo LLM reply, cached for an hour by (API key, agent, model, system prompt, prompt)
+
+    Called from a worker thread; the agent's coroutine runs on the shared
+    background loop. LLM errors propagate, so failed replies are never cached.
+    The body only runs on a cache miss, which it records in _generated.
+    """
+    reply = run_async(_agent.generate_response(CONVERSATION_ID, prompt))
+    _generated.append(True)
+    return reply
+
+
+async def generate_reply(agent: LLMAgent, api_key_hash: str, agent_name: str, prompt: str) -> str:
+    """Cached demo reply, or an error message that is shown but not cached"""
+    generated = []
+    try:
+        reply = await asyncio.to_thread(
+            cached_llm_response,
+            agent,
+            generated,
+            api_key_hash,
+            agent_name,
+            agent.model_name,
+            agent.system_prompt,
+            prompt
+        )
+    except Exception as e:
+        return f"I apologize, but I encountered an error: {str(e)}"
+    
+    # Cache hit: generate_response did not run, so record the turn ourselves
+    # to keep the agent's history the same either way
+    if not generated:
+        agent.record_exchange(CONVERSATION_ID, prompt, reply)
+    return reply
+
+
+async def wait_for_floor(client: httpx.AsyncClient, speakerUri: str) -> None:
+    """Poll the floor holder with exponential backoff (the grant is usually immediate)"""
+    for attempt in range(DEMO_MAX_FLOOR_CHECKS):
+        holder_resp = await client.get(f"/floor/holder/{CONVERSATION_ID}")
+        if holder_resp.status_code == 200:
+            if holder_resp.json().get("holder") == speakerUri:
+                return
+        await asyncio.sleep(min(0.05 * 2 ** attempt, 1.0))
+
+
+async def run_one(
+    client: httpx.AsyncClient,
+    agent_name: str,
+    agent: LLMAgent,
+    api_key_hash: str,
+    prompt: str,
+    messages: deque
+) -> None:
+    """
+    Run one demo turn: request the floor, generate, speak, release
+
+    The LLM call runs while waiting for the floor, so only the floor
+    handoff itself is serialized between concurrent turns.
+    """
+    agent_info = AGENTS[agent_name]
+    
+    # Request floor
+    response = await grant_floor(client, agent_info["speakerUri"], agent_info["priority"])
+    if response.status_code != 200:
+        return
+    
+    # Get AI response while waiting for the floor
+    ai_response, _ = await asyncio.gather(
+        generate_reply(agent, api_key_hash, agent_name, prompt),
+        wait_for_floor(client, agent_info["speakerUri"])
+    )
+    
+    # Add AI response to chat
+    messages.append(ChatMsg(
+        role="assistant",
+        name=f"{agent_name} (AI)",
+        content=ai_response,
+        avatar=agent_info["emoji"],
+        timestamp=datetime.now().strftime("%H:%M:%S")
+    ))
+    
+    # Release floor
+    await release_floor(client, agent_info["speakerUri"])
+
+
+async def run_demo(agents_to_run: list, stages: list, messages: deque, api_key_hash: str) -> None:
+    """
+    Drive the automated demo on one event loop and one AsyncClient
+
+    Args:
+        agents_to_run: (name, agent, info) tuples for the demo agents
+        stages: Lists of (agent name, prompt) pairs; stages run in order,
+            the turns within a stage run concurrently
+        messages: Chat transcript to append to
+        api_key_hash: Hash of the OpenAI API key, part of the reply cache key
+    """
+    agents = {name: agent for name, agent, _ in agents_to_run}
+    
+    async with httpx.AsyncClient(base_url=FLOOR_API, http2=True, timeout=30.0) as client:
+        for stage in stages:
+            # Add user prompts to chat
+            for agent_name, prompt in stage:
+                messages.append(ChatMsg(
+                    role="user",
+                    name=f"{agent_name} (Auto)",
+                    content=f"🎬 {prompt}",
+                    avatar=AGENTS[agent_name]["emoji"],
+                    timestamp=datetime.now().strftime("%H:%M:%S")
+                ))
+            
+            await asyncio.gather(*(
+                run_one(client, agent_name, agents[agent_name], api_key_hash, prompt, messages)
+                for agent_name, prompt in stage
+            ))
+
 
 # Available agents
 AGENTS = {
@@ -37,6 +306,26 @@ AGENTS = {
     }
 }
 
+# speakerUri -> (agent name, emoji), for floor-holder display
+SPEAKER_URI_TO_AGENT = {info["speakerUri"]: (name, info["emoji"]) for name, info in AGENTS.items()}
+
+# Custom green button style for primary buttons
+CUSTOM_CSS = """
+<style>
+button[kind="primary"] {
+    background-color: #28a745 !important;
+    color: white !important;
+    border: none !important;
+}
+button[kind="primary"]:hover {
+    background-color: #218838 !important;
+}
+button[kind="primary"]:focus {
+    background-color: #28a745 !important;
+}
+</style>
+"""
+
 # Page config
 st.set_page_config(
     page_title="OFP Floor Manager Demo",
@@ -48,6 +337,38 @@ st.set_page_config(
 st.title("🎤 Open Floor Protocol - Multi-Agent Chat")
 st.markdown("**Interactive demo with real AI agents and floor control**")
 
+
+@st.fragment(run_every=5.0)
+def floor_status_fragment():
+    """Floor holder panel, refreshed on its own every few seconds"""
+    # Get current floor holder, trusting our own recent grant/release
+    last_holder = st.session_state.get("last_floor_holder")
+    if last_holder and time.time() - last_holder[1] < HOLDER_TRUST_SECONDS:
+        data = {"holder": last_holder[0]}
+    else:
+        data = fetch_floor_holder(CONVERSATION_ID)
+    if data is not None:
+        holder = data.get("holder")  # Can be None
+        
+        # Find agent name from speakerUri
+        holder_name, holder_emoji = SPEAKER_URI_TO_AGENT.get(holder, ("None", "⏸️"))
+        
+        if holder:
+            st.success(f"{holder_emoji} **{holder_name}** has floor")
+        else:
+            st.info("⏸️ Floor is free")
+    else:
+        st.error("🔌 Floor Manager not running")
+        st.caption(f"📡 Trying to connect to: {FLOOR_API}/floor/holder/{CONVERSATION_ID}")
+        st.caption("Start with: `docker-compose up`")
+        
+        # Detailed debug info in expander
+        with st.expander("🐛 Full Debug Info"):
+            st.write("**Configuration:**")
+            st.code(f"FLOOR_API = {FLOOR_API}")
+            st.code(f"CONVERSATION_ID = {CONVERSATION_ID}")
+
+
 # Sidebar - Configuration
 with st.sidebar:
     st.header("⚙️ Configuration")
@@ -60,7 +381,7 @@ with st.sidebar:
         help="Required for AI responses"
     )
     
-    if api_key:
+    if api_key and os.environ.get("OPENAI_API_KEY") != api_key:
         os.environ["OPENAI_API_KEY"] = api_key
     
     st.divider()
@@ -73,49 +394,10 @@ with st.sidebar:
     
     st.header("🎯 Floor Status")
     
-    # Get current floor holder
-    try:
-        response = httpx.get(f"{FLOOR_API}/floor/holder/{CONVERSATION_ID}", timeout=5.0)
-        if response.status_code == 200:
-            data = response.json()
-            holder = data.get("holder")  # Can be None
-            
-            # Find agent name from speakerUri
-            holder_name = "None"
-            holder_emoji = "⏸️"
-            
-            # Only search if holder is not None
-            if holder:
-                for name, info in AGENTS.items():
-                    if holder in info["speakerUri"]:
-                        holder_name = name
-                        holder_emoji = info["emoji"]
-                        break
-            
-            if holder:
-                st.success(f"{holder_emoji} **{holder_name}** has floor")
-            else:
-                st.info("⏸️ Floor is free")
-        else:
-            st.warning(f"⚠️ API returned status {response.status_code}")
-    except Exception as e:
-        st.error("🔌 Floor Manager not running")
-        st.caption(f"❌ Error: {str(e)}")
-        st.caption(f"🔍 Error type: {type(e).__name__}")
-        st.caption(f"📡 Trying to connect to: {FLOOR_API}/floor/holder/{CONVERSATION_ID}")
-        st.caption("Start with: `docker-compose up`")
-        
-        # Detailed debug info in expander
-        with st.expander("🐛 Full Debug Info"):
-            import traceback
-            st.code(traceback.format_exc())
-            st.write("**Configuration:**")
-            st.code(f"FLOOR_API = {FLOOR_API}")
-            st.code(f"CONVERSATION_ID = {CONVERSATION_ID}")
+    floor_status_fragment()
 
 # Initialize session state
-if "messages" not in st.session_state:
-    st.session_state.messages = []
+st.session_state.setdefault("messages", deque(maxlen=MAX_CHAT_MESSAGES))
 
 if "user_mode" not in st.session_state:
     st.session_state.user_mode = "observer"
@@ -134,140 +416,126 @@ with col2:
     )
     st.session_state.user_mode = mode.lower()
 
-# Display chat messages
-chat_container = st.container()
-
-with chat_container:
-    for msg in st.session_state.messages:
-        with st.chat_message(msg["role"], avatar=msg.get("avatar", "🤖")):
-            st.markdown(f"**{msg['name']}**")
-            st.write(msg["content"])
-            if "timestamp" in msg:
-                st.caption(msg["timestamp"])
-
-# User input area
-if st.session_state.user_mode == "participant":
-    # Select agent to use
-    col1, col2 = st.columns([3, 1])
+@st.fragment
+def chat_fragment():
+    """Chat transcript and participant turn; reruns on its own, skipping the sidebar"""
+    # Display chat messages
+    chat_container = st.container()
+
+    with chat_container:
+        for msg in st.session_state.messages:
+            with st.chat_message(msg.role, avatar=msg.avatar):
+                st.markdown(f"**{msg.name}**")
+                st.write(msg.content)
+                st.caption(msg.timestamp)
+
+    # User input area
+    if st.session_state.user_mode == "participant":
+        # Select agent to use
+        col1, col2 = st.columns([3, 1])
     
-    with col1:
-        user_input = st.chat_input("Type your message...")
+        with col1:
+            user_input = st.chat_input("Type your message...")
     
-    with col2:
-        selected_agent = st.selectbox(
-            "Speak as",
-            list(AGENTS.keys()),
-            key="agent_select"
-        )
+        with col2:
+            selected_agent = st.selectbox(
+                "Speak as",
+                list(AGENTS.keys()),
+                key="agent_select"
+            )
     
-    if user_input and api_key:
-        agent_info = AGENTS[selected_agent]
+        if user_input and api_key:
+            agent_info = AGENTS[selected_agent]
         
-        # Add user message to chat
-        st.session_state.messages.append({
-            "role": "user",
-            "name": selected_agent,
-            "content": user_input,
-            "avatar": agent_info["emoji"],
-            "timestamp": datetime.now().strftime("%H:%M:%S")
-        })
+            # Add user message to chat
+            st.session_state.messages.append(ChatMsg(
+                role="user",
+                name=selected_agent,
+                content=user_input,
+                avatar=agent_info["emoji"],
+                timestamp=datetime.now().strftime("%H:%M:%S")
+            ))
         
-        # Request floor
-        with st.spinner(f"{agent_info['emoji']} {selected_agent} requesting floor..."):
-            try:
-                response = httpx.post(
-                    f"{FLOOR_API}/floor/request",
-                    json={
-                        "conversation_id": CONVERSATION_ID,
-                        "speakerUri": agent_info["speakerUri"],
-                        "priority": agent_info["priority"]
-                    },
-                    timeout=10.0
-                )
+            streamed = False
+        
+            # Request floor
+            with st.spinner(f"{agent_info['emoji']} {selected_agent} requesting floor..."):
+                try:
+                    response = grant_floor(
+                        get_http_client(),
+                        agent_info["speakerUri"],
+                        agent_info["priority"]
+                    )
                 
-                if response.status_code == 200:
-                    data = response.json()
-                    granted = data.get("granted", False)
+                    if response.status_code == 200:
+                        data = response.json()
+                        granted = data.get("granted", False)
                     
-                    if granted:
-                        # Call LLM
-                        with st.spinner(f"{agent_info['emoji']} {selected_agent} thinking..."):
-                            # Import LLM agent
-                            import sys
-                            sys.path.insert(0, os.path.dirname(__file__))
-                            from src.agents.llm_agent import LLMAgent
-                            
-                            # Create agent
-                            agent = LLMAgent(
-                                speakerUri=agent_info["speakerUri"],
-                                agent_name=selected_agent,
-                                llm_provider="openai",
-                                model_name="gpt-4o-mini",
-                                system_prompt=agent_info["system_prompt"]
+                        if granted:
+                            st.session_state["last_floor_holder"] = (agent_info["speakerUri"], time.time())
+                            agent = get_llm_agent(
+                                agent_info["speakerUri"],
+                                selected_agent,
+                                "gpt-4o-mini",
+                                agent_info["system_prompt"],
+                                api_key
                             )
-                            
-                            # Get AI response (sync call)
-                            loop = asyncio.new_event_loop()
-                            asyncio.set_event_loop(loop)
-                            ai_response = loop.run_until_complete(
-                                agent.process_utterance(
-                                    CONVERSATION_ID,
-                                    user_input,
-                                    "tag:user,2025:human"
-                                )
-                            )
-                            loop.close()
-                            
+                        
+                            with chat_container, st.chat_message("user", avatar=agent_info["emoji"]):
+                                st.markdown(f"**{selected_agent}**")
+                                st.write(user_input)
+                        
+                            # Stream AI response into the chat as it is generated
+                            with chat_container, st.chat_message("assistant", avatar=agent_info["emoji"]):
+                                st.markdown(f"**{selected_agent} (AI)**")
+                                placeholder = st.empty()
+                                buf = []
+                                for token in iter_async(
+                                    agent.stream_utterance(
+                                        CONVERSATION_ID,
+                                        user_input,
+                                        "tag:user,2025:human"
+                                    )
+                                ):
+                                    buf.append(token)
+                                    placeholder.markdown("".join(buf))
+                            ai_response = "".join(buf)
+                        
                             # Add AI response to chat
-                            st.session_state.messages.append({
-                                "role": "assistant",
-                                "name": f"{selected_agent} (AI)",
-                                "content": ai_response,
-                                "avatar": agent_info["emoji"],
-                                "timestamp": datetime.now().strftime("%H:%M:%S")
-                            })
-                            
+                            st.session_state.messages.append(ChatMsg(
+                                role="assistant",
+                                name=f"{selected_agent} (AI)",
+                                content=ai_response,
+                                avatar=agent_info["emoji"],
+                                timestamp=datetime.now().strftime("%H:%M:%S")
+                            ))
+                            streamed = True
+                        
                             # Release floor
-                            httpx.post(
-                                f"{FLOOR_API}/floor/release",
-                                json={
-                                    "conversation_id": CONVERSATION_ID,
-                                    "speakerUri": agent_info["speakerUri"]
-                                },
-                                timeout=5.0
-                            )
-                    else:
-                        st.warning(f"⏳ {selected_agent} queued. Another agent has floor.")
+                            release_floor(get_http_client(), agent_info["speakerUri"])
+                            st.session_state["last_floor_holder"] = (None, time.time())
+                        else:
+                            st.warning(f"⏳ {selected_agent} queued. Another agent has floor.")
                 
-            except Exception as e:
-                st.error(f"❌ Error: {str(e)}")
+                except Exception as e:
+                    st.error(f"❌ Error: {str(e)}")
         
-        # Rerun to show new messages
-        st.rerun()
+            # Rerun to show new messages (a streamed reply is already on screen)
+            if not streamed:
+                st.rerun(scope="fragment")
     
-    elif user_input and not api_key:
-        st.warning("⚠️ Please enter your OpenAI API key in the sidebar")
+        elif user_input and not api_key:
+            st.warning("⚠️ Please enter your OpenAI API key in the sidebar")
+
+
+chat_fragment()
 
-else:
+if st.session_state.user_mode != "participant":
     # Observer mode
     st.info("👁️ **Observer Mode** - Watch agents communicate (set to Participant to join)")
     
     # Custom green button style for primary buttons
-    st.markdown("""
-    <style>
-    button[kind="primary"] {
-        background-color: #28a745 !important;
-        color: white !important;
-        border: none !important;
-    }
-    button[kind="primary"]:hover {
-        background-color: #218838 !important;
-    }
-    button[kind="primary"]:focus {
-        background-color: #28a745 !important;
-    }
-    </style>
-    """, unsafe_allow_html=True)
+    st.markdown(CUSTOM_CSS, unsafe_allow_html=True)
     
     # Auto-run demo button
     if st.button("▶️ Run Automated Demo", type="primary"):
@@ -276,110 +544,43 @@ else:
         else:
             with st.spinner("🤖 Running multi-agent conversation..."):
                 try:
-                    # Import LLM agent
-                    import sys
-                    sys.path.insert(0, os.path.dirname(__file__))
-                    from src.agents.llm_agent import LLMAgent
-                    
                     # Create agents
                     agents_to_run = []
                     for name, info in AGENTS.items():
-                        agent = LLMAgent(
-                            speakerUri=info["speakerUri"],
-                            agent_name=name,
-                            llm_provider="openai",
-                            model_name="gpt-4o-mini",
-                            system_prompt=info["system_prompt"]
+                        agent = get_llm_agent(
+                            info["speakerUri"],
+                            name,
+                            "gpt-4o-mini",
+                            info["system_prompt"],
+                            api_key
                         )
                         agents_to_run.append((name, agent, info))
                     
-                    # Scenario prompts
-                    prompts = [
-                        ("Budget Analyst", "We're planning a 5-day trip to Paris. What's a reasonable budget per person?"),
-                        ("Travel Agent", "Based on a mid-range budget, what are the must-see attractions in Paris?"),
-                        ("Coordinator", "Great! Let's create a day-by-day itinerary combining budget and top attractions.")
+                    # Scenario prompts: Budget and Travel answer independently,
+                    # the Coordinator goes once both have spoken
+                    stages = [
+                        [
+                            ("Budget Analyst", "We're planning a 5-day trip to Paris. What's a reasonable budget per person?"),
+                            ("Travel Agent", "Based on a mid-range budget, what are the must-see attractions in Paris?")
+                        ],
+                        [
+                            ("Coordinator", "Great! Let's create a day-by-day itinerary combining budget and top attractions.")
+                        ]
                     ]
                     
                     # Run conversation
-                    loop = asyncio.new_event_loop()
-                    asyncio.set_event_loop(loop)
-                    
-                    for agent_name, prompt in prompts:
-                        # Find agent info
-                        agent_info = AGENTS[agent_name]
-                        agent = next(a for n, a, _ in agents_to_run if n == agent_name)
-                        
-                        # Add user prompt to chat
-                        st.session_state.messages.append({
-                            "role": "user",
-                            "name": f"{agent_name} (Auto)",
-                            "content": f"🎬 {prompt}",
-                            "avatar": agent_info["emoji"],
-                            "timestamp": datetime.now().strftime("%H:%M:%S")
-                        })
-                        
-                        # Request floor
-                        response = httpx.post(
-                            f"{FLOOR_API}/floor/request",
-                            json={
-                                "conversation_id": CONVERSATION_ID,
-                                "speakerUri": agent_info["speakerUri"],
-                                "priority": agent_info["priority"]
-                            },
-                            timeout=10.0
-                        )
-                        
-                        if response.status_code == 200:
-                            # Wait for floor if needed
-                            max_wait = 10
-                            for _ in range(max_wait):
-                                holder_resp = httpx.get(
-                                    f"{FLOOR_API}/floor/holder/{CONVERSATION_ID}",
-                                    timeout=5.0
-                                )
-                                if holder_resp.status_code == 200:
-                                    holder_data = holder_resp.json()
-                                    if agent_info["speakerUri"] in holder_data.get("holder", ""):
-                                        break
-                                import time
-                                time.sleep(1)
-                            
-                            # Get AI response
-                            ai_response = loop.run_until_complete(
-                                agent.process_utterance(
-                                    CONVERSATION_ID,
-                                    prompt,
-                                    "tag:demo,2025:system"
-                                )
-                            )
-                            
-                            # Add AI response to chat
-                            st.session_state.messages.append({
-                                "role": "assistant",
-                                "name": f"{agent_name} (AI)",
-                                "content": ai_response,
-                                "avatar": agent_info["emoji"],
-                                "timestamp": datetime.now().strftime("%H:%M:%S")
-                            })
-                            
-                            # Release floor
-                            httpx.post(
-                                f"{FLOOR_API}/floor/release",
-                                json={
-                                    "conversation_id": CONVERSATION_ID,
-                                    "speakerUri": agent_info["speakerUri"]
-                                },
-                                timeout=5.0
-                            )
-                    
-                    loop.close()
+                    run_async(run_demo(
+                        agents_to_run,
+                        stages,
+                        st.session_state.messages,
+                        hashlib.sha256(api_key.encode()).hexdigest()
+                    ))
                     
                     st.success("✅ Automated demo completed!")
                     st.balloons()
                     
                 except Exception as e:
                     st.error(f"❌ Error running demo: {str(e)}")
-                    import traceback
                     st.code(traceback.format_exc())
                 
                 # Rerun to show messages
@@ -391,11 +592,12 @@ col1, col2, col3 = st.columns(3)
 
 with col1:
     if st.button("🗑️ Clear Chat"):
-        st.session_state.messages = []
+        st.session_state.messages.clear()
         st.rerun()
 
 with col2:
     if st.button("🔄 Refresh Floor Status"):
+        fetch_floor_holder.clear()
         st.rerun()
 
 with col3:
@@ -10,14 +10,238 @@ Run: streamlit run streamlit_app_realtime.py
 
 import streamlit as st
 import asyncio
+import atexit
 import httpx
+import json
 import os
+import sys
+import traceback
+from collections import deque
 from datetime import datetime
+from typing import Optional
 import streamlit.components.v1 as components
 
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+from src.agents.llm_agent import LLMAgent
+
 # Configuration
 FLOOR_API = "http://localhost:8787/api/v1"
 CONVERSATION_ID = "streamlit_chat_001"
+DEMO_GRANT_TIMEOUT = 10.0
+MAX_CHAT_MESSAGES = 200
+
+
+@st.cache_resource
+def get_http_client() -> httpx.Client:
+    """Shared Floor Manager client, kept across reruns to reuse keep-alive connections"""
+    client = httpx.Client(
+        base_url=FLOOR_API,
+        timeout=10.0,
+        limits=httpx.Limits(max_keepalive_connections=20, max_connections=100)
+    )
+    atexit.register(client.close)
+    return client
+
+
+def _probe_once() -> bool:
+    """Check that the Floor Manager answers, failing fast if it is down"""
+    try:
+        response = get_http_client().get(f"/floor/holder/{CONVERSATION_ID}", timeout=0.5)
+        return response.status_code == 200
+    except httpx.HTTPError:
+        return False
+
+
+def get_session_loop() -> asyncio.AbstractEventLoop:
+    """
+    Event loop reused for every LLM call in this browser session
+
+    Async clients created inside LLMAgent stay bound to the loop they first
+    ran on, so reusing one loop keeps their connections warm between turns.
+    """
+    if "loop" not in st.session_state:
+        st.session_state.loop = asyncio.new_event_loop()
+    return st.session_state.loop
+
+
+def iter_session_async(agen):
+    """
+    Drive an async generator on the session loop, yielding items synchronously
+
+    The generator is closed even if iteration stops early (exception or
+    rerun), so the LLM stream does not keep its connection open.
+    """
+    loop = get_session_loop()
+    try:
+        while True:
+            try:
+                yield loop.run_until_complete(agen.__anext__())
+            except StopAsyncIteration:
+                return
+    finally:
+        loop.run_until_complete(agen.aclose())
+
+
+def get_llm_agent(speakerUri: str, agent_name: str, system_prompt: str, api_key: str) -> LLMAgent:
+    """
+    Build each demo agent once per session and reuse it across reruns
+
+    Kept in session state rather than st.cache_resource: the agent's async
+    LLM client is bound to the session's event loop. The client reads the API
+    key when it is built, so the agent is rebuilt when the key changes.
+    """
+    agents = st.session_state.setdefault("llm_agents", {})
+    cached = agents.get(speakerUri)
+    if cached is None or cached[0] != api_key:
+        cached = agents[speakerUri] = (api_key, LLMAgent(
+            speakerUri=speakerUri,
+            agent_name=agent_name,
+            llm_provider="openai",
+            model_name="gpt-4o-mini",
+            system_prompt=system_prompt
+        ))
+    return cached[1]
+
+
+class _FloorWatcher:
+    """Tracks the floor holder from the SSE stream for the demo run"""
+
+    def __init__(self) -> None:
+        self.holder = None
+        self.ready = asyncio.Event()
+        self._changed = asyncio.Event()
+
+    async def run(self, client: httpx.AsyncClient) -> None:
+        """Consume floor events until cancelled"""
+        async with client.stream("GET", f"/floor/events/floor/{CONVERSATION_ID}", timeout=None) as response:
+            async for line in response.aiter_lines():
+                if not line.startswith("data:"):
+                    continue
+                event = json.loads(line[5:])
+                if event.get("type") == "initial_status":
+                    self.holder = event.get("holder")
+                elif event.get("type") == "floor_update":
+                    self.holder = event["data"].get("holder")
+                else:
+                    continue
+                self.ready.set()
+                # Wake current waiters; later waiters get a fresh event
+                self._changed.set()
+                self._changed = asyncio.Event()
+
+    async def wait_for(self, speakerUri: str) -> None:
+        """Return once speakerUri holds the floor"""
+        while self.holder != speakerUri:
+            await self._changed.wait()
+
+
+async def _run_turn(
+    client: httpx.AsyncClient,
+    watcher: _FloorWatcher,
+    agent_name: str,
+    agent: LLMAgent,
+    prompt: str
+) -> Optional[tuple]:
+    """
+    Request the floor, generate, speak once granted, and release
+
+    The LLM call starts right after the floor request, so concurrent turns
+    overlap their generation and only wait on each other for the floor.
+
+    Returns:
+        (grant time, chat messages) or None if the request was rejected
+    """
+    agent_info = AGENTS[agent_name]
+    
+    prompt_message = {
+        "role": "user",
+        "name": f"{agent_name} (Auto)",
+        "content": f"🎬 {prompt}",
+        "avatar": agent_info["emoji"],
+        "timestamp": datetime.now().strftime("%H:%M:%S")
+    }
+    
+    # Request floor
+    response = await client.post(
+        "/floor/request",
+        json={
+            "conversation_id": CONVERSATION_ID,
+            "speakerUri": agent_info["speakerUri"],
+            "priority": agent_info["priority"]
+        }
+    )
+    if response.status_code != 200:
+        return None
+    
+    # Get AI response while waiting for the floor
+    llm_call = asyncio.create_task(
+        agent.process_utterance(
+            CONVERSATION_ID,
+            prompt,
+            "tag:demo,2025:system"
+        )
+    )
+    
+    # Wait for floor if needed (pushed over SSE)
+    if not response.json().get("granted"):
+        try:
+            await asyncio.wait_for(watcher.wait_for(agent_info["speakerUri"]), DEMO_GRANT_TIMEOUT)
+        except asyncio.TimeoutError:
+            pass
+    granted_at = asyncio.get_running_loop().time()
+    
+    ai_response = await llm_call
+    ai_message = {
+        "role": "assistant",
+        "name": f"{agent_name} (AI)",
+        "content": ai_response,
+        "avatar": agent_info["emoji"],
+        "timestamp": datetime.now().strftime("%H:%M:%S")
+    }
+    
+    # Release floor
+    await client.post(
+        "/floor/release",
+        json={
+            "conversation_id": CONVERSATION_ID,
+            "speakerUri": agent_info["speakerUri"]
+        }
+    )
+    
+    return granted_at, [prompt_message, ai_message]
+
+
+async def run_demo(agents_to_run: list, prompts: list) -> None:
+    """
+    Run the automated demo turns concurrently over a single AsyncClient
+
+    The Floor Manager's priority queue decides who speaks first; messages
+    are added to the chat in grant order once every turn is done.
+
+    Args:
+        agents_to_run: (name, agent, info) tuples for the demo agents
+        prompts: (agent name, prompt) pairs
+    """
+    agents = {name: agent for name, agent, _ in agents_to_run}
+    watcher = _FloorWatcher()
+    
+    async with httpx.AsyncClient(base_url=FLOOR_API, timeout=10.0) as client:
+        # Subscribe before the first request so no grant is missed
+        reader = asyncio.create_task(watcher.run(client))
+        try:
+            await asyncio.wait_for(watcher.ready.wait(), DEMO_GRANT_TIMEOUT)
+            tasks = [
+                asyncio.create_task(_run_turn(client, watcher, agent_name, agents[agent_name], prompt))
+                for agent_name, prompt in prompts
+            ]
+            results = await asyncio.gather(*tasks)
+        finally:
+            reader.cancel()
+    
+    completed = [result for result in results if result is not None]
+    for _, messages in sorted(completed, key=lambda result: result[0]):
+        st.session_state.messages.extend(messages)
+
 
 # Available agents
 AGENTS = {
@@ -41,6 +265,9 @@ AGENTS = {
     }
 }
 
+# speakerUri -> (agent name, emoji), for floor-holder display
+URI_TO_AGENT = {info["speakerUri"]: (name, info["emoji"]) for name, info in AGENTS.items()}
+
 # Page config
 st.set_page_config(
     page_title="OFP Floor Manager Demo (Real-Time)",
@@ -53,66 +280,136 @@ st.title("🎤 Open Floor Protocol - Multi-Agent Chat")
 st.markdown("**Interactive demo with real-time floor status updates** ⚡")
 
 # SSE JavaScript Component
+@st.cache_data(show_spinner=False)
 def create_sse_component():
     """Create JavaScript component for SSE connection"""
     sse_js = f"""
+    <div id="floor-status-realtime"></div>
     <script>
     (function() {{
-        const eventSource = new EventSource('{FLOOR_API}/events/floor/{CONVERSATION_ID}');
+        // Close any EventSource left over from a previous render
+        if (window.__floorES) {{
+            try {{ window.__floorES.close(); }} catch (e) {{}}
+        }}
+        
         const statusDiv = document.getElementById('floor-status-realtime');
+        const AGENT_LABELS = {json.dumps({uri: f"{emoji} {name}" for uri, (name, emoji) in URI_TO_AGENT.items()})};
+        const MAX_LIFETIME_MS = 30 * 60 * 1000;
+        let attempt = 0;
+        let expired = false;
+        let pending = null;
+        let scheduled = false;
+        const POST_HEIGHT_INTERVAL_MS = 100;
+        let lastPost = -Infinity;
+        let pendingPost = null;
         
-        eventSource.onmessage = function(event) {{
-            try {{
-                const data = JSON.parse(event.data);
+        function flush() {{
+            scheduled = false;
+            if (!pending) {{
+                return;
+            }}
+            const data = pending;
+            pending = null;
+            
+            // Update status display
+            if (statusDiv) {{
+                const holder = data.data?.holder || data.holder || 'None';
+                const queue = data.data?.queue || data.queue || [];
                 
-                if (data.type === 'floor_update' || data.type === 'initial_status') {{
-                    // Update status display
-                    if (statusDiv) {{
-                        const holder = data.data?.holder || data.holder || 'None';
-                        const queue = data.data?.queue || data.queue || [];
-                        
-                        let html = '<div style="padding: 10px; border-radius: 5px; background: #f0f2f6;">';
-                        html += '<strong>🎯 Floor Status (Real-Time)</strong><br>';
-                        
-                        if (holder && holder !== 'None') {{
-                            html += '<div style="color: green; margin-top: 5px;">✅ Holder: ' + holder + '</div>';
-                        }} else {{
-                            html += '<div style="color: gray; margin-top: 5px;">⏸️ Floor is free</div>';
-                        }}
-                        
-                        if (queue && queue.length > 0) {{
-                            html += '<div style="margin-top: 5px;">📋 Queue: ' + queue.length + ' waiting</div>';
+                let html = '<div style="padding: 10px; border-radius: 5px; background: #f0f2f6;">';
+                html += '<strong>🎯 Floor Status (Real-Time)</strong><br>';
+                
+                if (holder && holder !== 'None') {{
+                    html += '<div style="color: green; margin-top: 5px;">✅ Holder: ' + (AGENT_LABELS[holder] || holder) + '</div>';
+                }} else {{
+                    html += '<div style="color: gray; margin-top: 5px;">⏸️ Floor is free</div>';
+                }}
+                
+                if (queue && queue.length > 0) {{
+                    html += '<div style="margin-top: 5px;">📋 Queue: ' + queue.length + ' waiting</div>';
+                }}
+                
+                html += '</div>';
+                statusDiv.innerHTML = html;
+            }}
+            
+            postHeight();
+        }}
+        
+        // Resize the Streamlit iframe at most once per POST_HEIGHT_INTERVAL_MS
+        function postHeight() {{
+            const now = performance.now();
+            if (now - lastPost < POST_HEIGHT_INTERVAL_MS) {{
+                clearTimeout(pendingPost);
+                pendingPost = setTimeout(postHeight, POST_HEIGHT_INTERVAL_MS - (now - lastPost));
+                return;
+            }}
+            lastPost = now;
+            window.parent.postMessage({{
+                type: 'streamlit:setFrameHeight',
+                height: document.body.scrollHeight
+            }}, '*');
+        }}
+        
+        function connect() {{
+            const eventSource = new EventSource('{FLOOR_API}/floor/events/floor/{CONVERSATION_ID}');
+            window.__floorES = eventSource;
+            
+            eventSource.onopen = function() {{
+                attempt = 0;
+            }};
+            
+            eventSource.onmessage = function(event) {{
+                try {{
+                    const data = JSON.parse(event.data);
+                    
+                    if (data.type === 'floor_update' || data.type === 'initial_status') {{
+                        // Keep only the latest state; render once per animation frame
+                        pending = data;
+                        if (!scheduled) {{
+                            scheduled = true;
+                            requestAnimationFrame(flush);
                         }}
-                        
-                        html += '</div>';
-                        statusDiv.innerHTML = html;
                     }}
-                    
-                    // Trigger Streamlit rerun by updating a hidden element
-                    window.parent.postMessage({{
-                        type: 'streamlit:setFrameHeight',
-                        height: document.body.scrollHeight
-                    }}, '*');
+                }} catch (e) {{
+                    console.error('SSE parse error:', e);
                 }}
-            }} catch (e) {{
-                console.error('SSE parse error:', e);
-            }}
-        }};
+            }};
+            
+            eventSource.onerror = function(error) {{
+                console.error('SSE error:', error);
+                if (statusDiv) {{
+                    statusDiv.innerHTML = '<div style="color: red;">🔌 Connection lost</div>';
+                }}
+                
+                // Reconnect with exponential backoff instead of the browser's fixed retry
+                eventSource.close();
+                if (!expired && window.__floorES === eventSource) {{
+                    const retry = Math.min(30000, 1000 * 2 ** attempt);
+                    attempt += 1;
+                    setTimeout(connect, retry);
+                }}
+            }};
+        }}
         
-        eventSource.onerror = function(error) {{
-            console.error('SSE error:', error);
-            if (statusDiv) {{
-                statusDiv.innerHTML = '<div style="color: red;">🔌 Connection lost</div>';
+        connect();
+        
+        // Hard cap on connection lifetime
+        setTimeout(function() {{
+            expired = true;
+            if (window.__floorES) {{
+                window.__floorES.close();
             }}
-        }};
+        }}, MAX_LIFETIME_MS);
         
         // Cleanup on page unload
         window.addEventListener('beforeunload', function() {{
-            eventSource.close();
+            if (window.__floorES) {{
+                window.__floorES.close();
+            }}
         }});
     }})();
     </script>
-    <div id="floor-status-realtime"></div>
     """
     return sse_js
 
@@ -128,7 +425,7 @@ with st.sidebar:
         help="Required for AI responses"
     )
     
-    if api_key:
+    if api_key and os.environ.get("OPENAI_API_KEY") != api_key:
         os.environ["OPENAI_API_KEY"] = api_key
     
     st.divider()
@@ -144,35 +441,17 @@ with st.sidebar:
     # SSE Component for real-time updates
     components.html(create_sse_component(), height=150)
     
-    # Fallback: Also show current status via HTTP
-    try:
-        response = httpx.get(f"{FLOOR_API}/floor/holder/{CONVERSATION_ID}", timeout=2.0)
-        if response.status_code == 200:
-            data = response.json()
-            holder = data.get("holder")  # Can be None
-            
-            holder_name = "None"
-            holder_emoji = "⏸️"
-            
-            # Only search if holder is not None
-            if holder:
-                for name, info in AGENTS.items():
-                    if holder in info["speakerUri"]:
-                        holder_name = name
-                        holder_emoji = info["emoji"]
-                        break
-            
-            if holder:
-                st.success(f"{holder_emoji} **{holder_name}** has floor")
-            else:
-                st.info("⏸️ Floor is free")
-    except:
+    # One reachability probe per session; holder state comes from the SSE component
+    if "floor_manager_reachable" not in st.session_state:
+        st.session_state.floor_manager_reachable = _probe_once()
+    
+    if not st.session_state.floor_manager_reachable:
         st.warning("🔌 Floor Manager not running")
         st.caption("Start with: `docker-compose up`")
 
 # Initialize session state
 if "messages" not in st.session_state:
-    st.session_state.messages = []
+    st.session_state.messages = deque(maxlen=MAX_CHAT_MESSAGES)
 
 if "user_mode" not in st.session_state:
     st.session_state.user_mode = "observer"
@@ -191,85 +470,86 @@ with col2:
     )
     st.session_state.user_mode = mode.lower()
 
-# Display chat messages
-chat_container = st.container()
+@st.fragment
+def chat_panel():
+    """Chat transcript and participant input; reruns without the sidebar or SSE component"""
+    # Display chat messages
+    chat_container = st.container()
 
-with chat_container:
-    for msg in st.session_state.messages:
-        with st.chat_message(msg["role"], avatar=msg.get("avatar", "🤖")):
-            st.markdown(f"**{msg['name']}**")
-            st.write(msg["content"])
-            if "timestamp" in msg:
-                st.caption(msg["timestamp"])
+    with chat_container:
+        for msg in st.session_state.messages:
+            with st.chat_message(msg["role"], avatar=msg.get("avatar", "🤖")):
+                st.markdown(f"**{msg['name']}**")
+                st.write(msg["content"])
+                if "timestamp" in msg:
+                    st.caption(msg["timestamp"])
 
-# User input area (same as original)
-if st.session_state.user_mode == "participant":
-    col1, col2 = st.columns([3, 1])
+    # User input area (same as original)
+    if st.session_state.user_mode == "participant":
+        col1, col2 = st.columns([3, 1])
     
-    with col1:
-        user_input = st.chat_input("Type your message...")
+        with col1:
+            user_input = st.chat_input("Type your message...")
     
-    with col2:
-        selected_agent = st.selectbox(
-            "Speak as",
-            list(AGENTS.keys()),
-            key="agent_select"
-        )
+        with col2:
+            selected_agent = st.selectbox(
+                "Speak as",
+                list(AGENTS.keys()),
+                key="agent_select"
+            )
     
-    if user_input and api_key:
-        agent_info = AGENTS[selected_agent]
+        if user_input and api_key:
+            agent_info = AGENTS[selected_agent]
         
-        st.session_state.messages.append({
-            "role": "user",
-            "name": selected_agent,
-            "content": user_input,
-            "avatar": agent_info["emoji"],
-            "timestamp": datetime.now().strftime("%H:%M:%S")
-        })
+            st.session_state.messages.append({
+                "role": "user",
+                "name": selected_agent,
+                "content": user_input,
+                "avatar": agent_info["emoji"],
+                "timestamp": datetime.now().strftime("%H:%M:%S")
+            })
+            with chat_container, st.chat_message("user", avatar=agent_info["emoji"]):
+                st.markdown(f"**{selected_agent}**")
+                st.write(user_input)
         
-        # Request floor
-        with st.spinner(f"{agent_info['emoji']} {selected_agent} requesting floor..."):
-            try:
-                response = httpx.post(
-                    f"{FLOOR_API}/floor/request",
-                    json={
-                        "conversation_id": CONVERSATION_ID,
-                        "speakerUri": agent_info["speakerUri"],
-                        "priority": agent_info["priority"]
-                    },
-                    timeout=10.0
-                )
+            # Request floor
+            with st.spinner(f"{agent_info['emoji']} {selected_agent} requesting floor..."):
+                try:
+                    response = get_http_client().post(
+                        "/floor/request",
+                        json={
+                            "conversation_id": CONVERSATION_ID,
+                            "speakerUri": agent_info["speakerUri"],
+                            "priority": agent_info["priority"]
+                        },
+                        timeout=10.0
+                    )
                 
-                if response.status_code == 200:
-                    data = response.json()
-                    granted = data.get("granted", False)
+                    if response.status_code == 200:
+                        data = response.json()
+                        granted = data.get("granted", False)
                     
-                    if granted:
-                        # Call LLM (same as original)
-                        with st.spinner(f"{agent_info['emoji']} {selected_agent} thinking..."):
-                            import sys
-                            sys.path.insert(0, os.path.dirname(__file__))
-                            from src.agents.llm_agent import LLMAgent
-                            
-                            agent = LLMAgent(
-                                speakerUri=agent_info["speakerUri"],
-                                agent_name=selected_agent,
-                                llm_provider="openai",
-                                model_name="gpt-4o-mini",
-                                system_prompt=agent_info["system_prompt"]
+                        if granted:
+                            agent = get_llm_agent(
+                                agent_info["speakerUri"],
+                                selected_agent,
+                                agent_info["system_prompt"],
+                                api_key
                             )
-                            
-                            loop = asyncio.new_event_loop()
-                            asyncio.set_event_loop(loop)
-                            ai_response = loop.run_until_complete(
-                                agent.process_utterance(
-                                    CONVERSATION_ID,
-                                    user_input,
-                                    "tag:user,2025:human"
+                        
+                            # Stream LLM tokens into the chat as they arrive
+                            with chat_container, st.chat_message("assistant", avatar=agent_info["emoji"]):
+                                st.markdown(f"**{selected_agent} (AI)**")
+                                ai_response = st.write_stream(
+                                    iter_session_async(
+                                        agent.stream_utterance(
+                                            CONVERSATION_ID,
+                                            user_input,
+                                            "tag:user,2025:human"
+                                        )
+                                    )
                                 )
-                            )
-                            loop.close()
-                            
+                        
                             st.session_state.messages.append({
                                 "role": "assistant",
                                 "name": f"{selected_agent} (AI)",
@@ -277,28 +557,29 @@ if st.session_state.user_mode == "participant":
                                 "avatar": agent_info["emoji"],
                                 "timestamp": datetime.now().strftime("%H:%M:%S")
                             })
-                            
+                        
                             # Release floor
-                            httpx.post(
-                                f"{FLOOR_API}/floor/release",
+                            get_http_client().post(
+                                "/floor/release",
                                 json={
                                     "conversation_id": CONVERSATION_ID,
                                     "speakerUri": agent_info["speakerUri"]
                                 },
                                 timeout=5.0
                             )
-                    else:
-                        st.warning(f"⏳ {selected_agent} queued. Another agent has floor.")
+                        else:
+                            st.warning(f"⏳ {selected_agent} queued. Another agent has floor.")
                 
-            except Exception as e:
-                st.error(f"❌ Error: {str(e)}")
-        
-        st.rerun()
+                except Exception as e:
+                    st.error(f"❌ Error: {str(e)}")
     
-    elif user_input and not api_key:
-        st.warning("⚠️ Please enter your OpenAI API key in the sidebar")
+        elif user_input and not api_key:
+            st.warning("⚠️ Please enter your OpenAI API key in the sidebar")
 
-else:
+
+chat_panel()
+
+if st.session_state.user_mode != "participant":
     st.info("👁️ **Observer Mode** - Watch agents communicate (set to Participant to join)")
     
     # Custom green button style for primary buttons
@@ -324,21 +605,10 @@ else:
         else:
             with st.spinner("🤖 Running multi-agent conversation..."):
                 try:
-                    # Import LLM agent
-                    import sys
-                    sys.path.insert(0, os.path.dirname(__file__))
-                    from src.agents.llm_agent import LLMAgent
-                    
                     # Create agents
                     agents_to_run = []
                     for name, info in AGENTS.items():
-                        agent = LLMAgent(
-                            speakerUri=info["speakerUri"],
-                            agent_name=name,
-                            llm_provider="openai",
-                            model_name="gpt-4o-mini",
-                            system_prompt=info["system_prompt"]
-                        )
+                        agent = get_llm_agent(info["speakerUri"], name, info["system_prompt"], api_key)
                         agents_to_run.append((name, agent, info))
                     
                     # Scenario prompts
@@ -349,85 +619,13 @@ else:
                     ]
                     
                     # Run conversation
-                    loop = asyncio.new_event_loop()
-                    asyncio.set_event_loop(loop)
-                    
-                    for agent_name, prompt in prompts:
-                        # Find agent info
-                        agent_info = AGENTS[agent_name]
-                        agent = next(a for n, a, _ in agents_to_run if n == agent_name)
-                        
-                        # Add user prompt to chat
-                        st.session_state.messages.append({
-                            "role": "user",
-                            "name": f"{agent_name} (Auto)",
-                            "content": f"🎬 {prompt}",
-                            "avatar": agent_info["emoji"],
-                            "timestamp": datetime.now().strftime("%H:%M:%S")
-                        })
-                        
-                        # Request floor
-                        response = httpx.post(
-                            f"{FLOOR_API}/floor/request",
-                            json={
-                                "conversation_id": CONVERSATION_ID,
-                                "speakerUri": agent_info["speakerUri"],
-                                "priority": agent_info["priority"]
-                            },
-                            timeout=10.0
-                        )
-                        
-                        if response.status_code == 200:
-                            # Wait for floor if needed
-                            max_wait = 10
-                            for _ in range(max_wait):
-                                holder_resp = httpx.get(
-                                    f"{FLOOR_API}/floor/holder/{CONVERSATION_ID}",
-                                    timeout=5.0
-                                )
-                                if holder_resp.status_code == 200:
-                                    holder_data = holder_resp.json()
-                                    if agent_info["speakerUri"] in holder_data.get("holder", ""):
-                                        break
-                                import time
-                                time.sleep(1)
-                            
-                            # Get AI response
-                            ai_response = loop.run_until_complete(
-                                agent.process_utterance(
-                                    CONVERSATION_ID,
-                                    prompt,
-                                    "tag:demo,2025:system"
-                                )
-                            )
-                            
-                            # Add AI response to chat
-                            st.session_state.messages.append({
-                                "role": "assistant",
-                                "name": f"{agent_name} (AI)",
-                                "content": ai_response,
-                                "avatar": agent_info["emoji"],
-                                "timestamp": datetime.now().strftime("%H:%M:%S")
-                            })
-                            
-                            # Release floor
-                            httpx.post(
-                                f"{FLOOR_API}/floor/release",
-                                json={
-                                    "conversation_id": CONVERSATION_ID,
-                                    "speakerUri": agent_info["speakerUri"]
-                                },
-                                timeout=5.0
-                            )
-                    
-                    loop.close()
+                    get_session_loop().run_until_complete(run_demo(agents_to_run, prompts))
                     
                     st.success("✅ Automated demo completed!")
                     st.balloons()
                     
                 except Exception as e:
                     st.error(f"❌ Error running demo: {str(e)}")
-                    import traceback
                     st.code(traceback.format_exc())
                 
                 # Rerun to show messages
@@ -439,11 +637,12 @@ col1, col2, col3 = st.columns(3)
 
 with col1:
     if st.button("🗑️ Clear Chat"):
-        st.session_state.messages = []
+        st.session_state.messages.clear()
         st.rerun()
 
 with col2:
     if st.button("🔄 Refresh"):
+        st.session_state.pop("floor_manager_reachable", None)
         st.rerun()
 
 with col3:
@@ -462,9 +661,9 @@ with st.expander("ℹ️ How Real-Time Updates Work"):
     
     ### Technical Details
     
-    - **SSE Endpoint**: `GET /api/v1/events/floor/{conversation_id}`
+    - **SSE Endpoint**: `GET /api/v1/floor/events/floor/{conversation_id}`
     - **Update Frequency**: Real-time (when floor changes)
-    - **Fallback**: HTTP polling if SSE unavailable
+    - **Reachability**: one HTTP probe per session; the status panel is SSE-only
     
     ### Requirements
     
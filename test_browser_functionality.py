@@ -4,8 +4,10 @@ Browser Functionality Test Script
 Tests the Streamlit GUI and Floor Manager API endpoints
 """
 
+import asyncio
 import httpx
 import json
+import sys
 import time
 from typing import Dict, Any
 
@@ -13,6 +15,7 @@ from typing import Dict, Any
 STREAMLIT_URL = "http://localhost:8501"
 FLOOR_API = "http://localhost:8000/api/v1"
 CONVERSATION_ID = "streamlit_chat_001"
+SSE_PROBE_MAX_BYTES = 1024
 
 # Test agents
 AGENTS = {
@@ -31,50 +34,67 @@ AGENTS = {
 }
 
 
-def test_health_check() -> bool:
+# Output is collected per test block and written in one go
+_buf = []
+
+
+def log(*args) -> None:
+    """Queue a line of test output"""
+    _buf.append(" ".join(map(str, args)))
+
+
+def flush_log() -> None:
+    """Write queued output with a single write and flush"""
+    if _buf:
+        sys.stdout.write("\n".join(_buf) + "\n")
+        _buf.clear()
+    sys.stdout.flush()
+
+
+async def test_health_check_async(client: httpx.AsyncClient) -> bool:
     """Test Floor Manager health endpoint"""
-    print("🔍 Testing Floor Manager health...")
+    log("🔍 Testing Floor Manager health...")
     try:
-        response = httpx.get(f"{FLOOR_API.replace('/api/v1', '')}/health", timeout=5.0)
+        response = await client.get(f"{FLOOR_API.replace('/api/v1', '')}/health", timeout=5.0)
         if response.status_code == 200:
             data = response.json()
-            print(f"   ✅ Health check passed: {data}")
+            log(f"   ✅ Health check passed: {data}")
             return True
         else:
-            print(f"   ❌ Health check failed: {response.status_code}")
+            log(f"   ❌ Health check failed: {response.status_code}")
             return False
     except Exception as e:
-        print(f"   ❌ Health check error: {e}")
+        log(f"   ❌ Health check error: {e}")
         return False
 
 
-def test_streamlit_accessible() -> bool:
+async def test_streamlit_accessible_async(client: httpx.AsyncClient) -> bool:
     """Test if Streamlit GUI is accessible"""
-    print("🔍 Testing Streamlit GUI accessibility...")
+    log("🔍 Testing Streamlit GUI accessibility...")
     try:
-        response = httpx.get(STREAMLIT_URL, timeout=5.0)
+        response = await client.get(STREAMLIT_URL, timeout=5.0)
         if response.status_code == 200:
             # Check if it's actually Streamlit
             if "streamlit" in response.text.lower() or "Open Floor Protocol" in response.text:
-                print(f"   ✅ Streamlit GUI is accessible (HTTP {response.status_code})")
+                log(f"   ✅ Streamlit GUI is accessible (HTTP {response.status_code})")
                 return True
             else:
-                print(f"   ⚠️  Page accessible but doesn't look like Streamlit")
+                log(f"   ⚠️  Page accessible but doesn't look like Streamlit")
                 return False
         else:
-            print(f"   ❌ Streamlit not accessible: HTTP {response.status_code}")
+            log(f"   ❌ Streamlit not accessible: HTTP {response.status_code}")
             return False
     except Exception as e:
-        print(f"   ❌ Streamlit accessibility error: {e}")
+        log(f"   ❌ Streamlit accessibility error: {e}")
         return False
 
 
-def test_floor_request(agent_name: str, agent_info: Dict[str, Any]) -> bool:
+def test_floor_request(client: httpx.Client, agent_name: str, agent_info: Dict[str, Any]) -> bool:
     """Test floor request for an agent"""
-    print(f"🔍 Testing floor request for {agent_name}...")
+    log(f"🔍 Testing floor request for {agent_name}...")
     try:
-        response = httpx.post(
-            f"{FLOOR_API}/floor/request",
+        response = client.post(
+            "/floor/request",
             json={
                 "conversation_id": CONVERSATION_ID,
                 "speakerUri": agent_info["speakerUri"],
@@ -86,45 +106,45 @@ def test_floor_request(agent_name: str, agent_info: Dict[str, Any]) -> bool:
         if response.status_code == 200:
             data = response.json()
             granted = data.get("granted", False)
-            print(f"   ✅ Floor request successful: granted={granted}")
+            log(f"   ✅ Floor request successful: granted={granted}")
             return True
         else:
-            print(f"   ❌ Floor request failed: HTTP {response.status_code}")
-            print(f"   Response: {response.text}")
+            log(f"   ❌ Floor request failed: HTTP {response.status_code}")
+            log(f"   Response: {response.text}")
             return False
     except Exception as e:
-        print(f"   ❌ Floor request error: {e}")
+        log(f"   ❌ Floor request error: {e}")
         return False
 
 
-def test_floor_holder() -> bool:
+def test_floor_holder(client: httpx.Client) -> bool:
     """Test getting current floor holder"""
-    print("🔍 Testing floor holder endpoint...")
+    log("🔍 Testing floor holder endpoint...")
     try:
-        response = httpx.get(
-            f"{FLOOR_API}/floor/holder/{CONVERSATION_ID}",
+        response = client.get(
+            f"/floor/holder/{CONVERSATION_ID}",
             timeout=5.0
         )
         
         if response.status_code == 200:
             data = response.json()
             holder = data.get("holder")
-            print(f"   ✅ Floor holder retrieved: {holder}")
+            log(f"   ✅ Floor holder retrieved: {holder}")
             return True
         else:
-            print(f"   ❌ Floor holder request failed: HTTP {response.status_code}")
+            log(f"   ❌ Floor holder request failed: HTTP {response.status_code}")
             return False
     except Exception as e:
-        print(f"   ❌ Floor holder error: {e}")
+        log(f"   ❌ Floor holder error: {e}")
         return False
 
 
-def test_floor_release(agent_info: Dict[str, Any]) -> bool:
+def test_floor_release(client: httpx.Client, agent_info: Dict[str, Any]) -> bool:
     """Test floor release"""
-    print("🔍 Testing floor release...")
+    log("🔍 Testing floor release...")
     try:
-        response = httpx.post(
-            f"{FLOOR_API}/floor/release",
+        response = client.post(
+            "/floor/release",
             json={
                 "conversation_id": CONVERSATION_ID,
                 "speakerUri": agent_info["speakerUri"]
@@ -133,61 +153,64 @@ def test_floor_release(agent_info: Dict[str, Any]) -> bool:
         )
         
         if response.status_code == 200:
-            print(f"   ✅ Floor released successfully")
+            log(f"   ✅ Floor released successfully")
             return True
         else:
-            print(f"   ❌ Floor release failed: HTTP {response.status_code}")
+            log(f"   ❌ Floor release failed: HTTP {response.status_code}")
             return False
     except Exception as e:
-        print(f"   ❌ Floor release error: {e}")
+        log(f"   ❌ Floor release error: {e}")
         return False
 
 
-def test_sse_endpoint() -> bool:
+async def test_sse_endpoint_async(client: httpx.AsyncClient) -> bool:
     """Test SSE endpoint connectivity"""
-    print("🔍 Testing SSE endpoint...")
+    log("🔍 Testing SSE endpoint...")
     try:
         # Try to connect and get at least one message
         # Note: SSE endpoint is at /api/v1/floor/events/floor/{conversation_id}
-        with httpx.stream(
+        async with client.stream(
             "GET",
-            f"{FLOOR_API}/floor/events/floor/{CONVERSATION_ID}",
+            f"/floor/events/floor/{CONVERSATION_ID}",
             timeout=3.0
         ) as response:
             if response.status_code == 200:
-                # Try to read first line
-                try:
-                    first_line = next(response.iter_lines())
-                    if "data:" in first_line:
-                        print(f"   ✅ SSE endpoint is working")
+                # Read at most ~1KB, stopping as soon as an event arrives
+                buf = b""
+                async for chunk in response.aiter_raw(chunk_size=256):
+                    buf += chunk
+                    if b"data:" in buf:
+                        log(f"   ✅ SSE endpoint is working")
                         return True
-                    else:
-                        print(f"   ⚠️  SSE endpoint responded but format unexpected")
+                    if len(buf) > SSE_PROBE_MAX_BYTES:
+                        log(f"   ⚠️  SSE endpoint responded but format unexpected")
                         return False
-                except StopIteration:
-                    print(f"   ⚠️  SSE endpoint connected but no data received")
-                    return True  # Still counts as working
+                if buf:
+                    log(f"   ⚠️  SSE endpoint responded but format unexpected")
+                    return False
+                log(f"   ⚠️  SSE endpoint connected but no data received")
+                return True  # Still counts as working
             else:
-                print(f"   ❌ SSE endpoint failed: HTTP {response.status_code}")
+                log(f"   ❌ SSE endpoint failed: HTTP {response.status_code}")
                 return False
     except httpx.TimeoutException:
-        print(f"   ⚠️  SSE endpoint timeout (may be normal if no updates)")
+        log(f"   ⚠️  SSE endpoint timeout (may be normal if no updates)")
         return True  # Timeout is OK for SSE
     except Exception as e:
-        print(f"   ❌ SSE endpoint error: {e}")
+        log(f"   ❌ SSE endpoint error: {e}")
         return False
 
 
-def test_priority_queue() -> bool:
+def test_priority_queue(client: httpx.Client) -> bool:
     """Test priority-based floor queue"""
-    print("🔍 Testing priority queue...")
+    log("🔍 Testing priority queue...")
     try:
         # Request floor with different priorities
         results = []
         
         # Request with lowest priority first
-        response1 = httpx.post(
-            f"{FLOOR_API}/floor/request",
+        response1 = client.post(
+            "/floor/request",
             json={
                 "conversation_id": CONVERSATION_ID,
                 "speakerUri": AGENTS["Budget Analyst"]["speakerUri"],
@@ -198,8 +221,8 @@ def test_priority_queue() -> bool:
         results.append(("Budget Analyst", response1.status_code == 200))
         
         # Request with highest priority
-        response2 = httpx.post(
-            f"{FLOOR_API}/floor/request",
+        response2 = client.post(
+            "/floor/request",
             json={
                 "conversation_id": CONVERSATION_ID,
                 "speakerUri": AGENTS["Coordinator"]["speakerUri"],
@@ -211,8 +234,8 @@ def test_priority_queue() -> bool:
         
         # Check who has floor (should be Coordinator due to higher priority)
         time.sleep(0.5)
-        holder_response = httpx.get(
-            f"{FLOOR_API}/floor/holder/{CONVERSATION_ID}",
+        holder_response = client.get(
+            f"/floor/holder/{CONVERSATION_ID}",
             timeout=5.0
         )
         
@@ -221,23 +244,23 @@ def test_priority_queue() -> bool:
             holder = holder_data.get("holder", "")
             
             if AGENTS["Coordinator"]["speakerUri"] in holder:
-                print(f"   ✅ Priority queue working: Coordinator has floor (highest priority)")
+                log(f"   ✅ Priority queue working: Coordinator has floor (highest priority)")
                 return True
             else:
-                print(f"   ⚠️  Priority queue may not be working correctly. Holder: {holder}")
+                log(f"   ⚠️  Priority queue may not be working correctly. Holder: {holder}")
                 return False
         else:
-            print(f"   ❌ Could not verify priority queue")
+            log(f"   ❌ Could not verify priority queue")
             return False
             
     except Exception as e:
-        print(f"   ❌ Priority queue test error: {e}")
+        log(f"   ❌ Priority queue test error: {e}")
         return False
     finally:
         # Cleanup: release floor
         try:
-            httpx.post(
-                f"{FLOOR_API}/floor/release",
+            client.post(
+                "/floor/release",
                 json={
                     "conversation_id": CONVERSATION_ID,
                     "speakerUri": AGENTS["Coordinator"]["speakerUri"]
@@ -248,58 +271,82 @@ def test_priority_queue() -> bool:
             pass
 
 
+async def run_independent_tests() -> tuple:
+    """Run the stateless connectivity probes concurrently"""
+    async with httpx.AsyncClient(base_url=FLOOR_API, http2=True, timeout=10.0) as client:
+        return await asyncio.gather(
+            test_health_check_async(client),
+            test_streamlit_accessible_async(client),
+            test_sse_endpoint_async(client)
+        )
+
+
 def run_all_tests():
     """Run all tests"""
-    print("=" * 60)
-    print("🧪 Browser Functionality Test Suite")
-    print("=" * 60)
-    print()
+    log("=" * 60)
+    log("🧪 Browser Functionality Test Suite")
+    log("=" * 60)
+    log()
+    flush_log()
     
     results = []
     
-    # Basic connectivity tests
-    results.append(("Health Check", test_health_check()))
-    print()
-    results.append(("Streamlit Accessible", test_streamlit_accessible()))
-    print()
+    # Independent probes run concurrently
+    health, streamlit_ok, sse = asyncio.run(run_independent_tests())
+    results.append(("Health Check", health))
+    results.append(("Streamlit Accessible", streamlit_ok))
+    log()
+    flush_log()
     
-    # Floor control tests
-    results.append(("Floor Request", test_floor_request("Budget Analyst", AGENTS["Budget Analyst"])))
-    print()
-    results.append(("Floor Holder", test_floor_holder()))
-    print()
-    results.append(("Floor Release", test_floor_release(AGENTS["Budget Analyst"])))
-    print()
+    # One pooled client for the stateful tests: keep-alive (and HTTP/2 where negotiated)
+    with httpx.Client(
+        base_url=FLOOR_API,
+        http2=True,
+        timeout=10.0,
+        limits=httpx.Limits(max_keepalive_connections=10)
+    ) as client:
+        # Floor control tests
+        results.append(("Floor Request", test_floor_request(client, "Budget Analyst", AGENTS["Budget Analyst"])))
+        log()
+        flush_log()
+        results.append(("Floor Holder", test_floor_holder(client)))
+        log()
+        flush_log()
+        results.append(("Floor Release", test_floor_release(client, AGENTS["Budget Analyst"])))
+        log()
+        flush_log()
+        
+        # Advanced tests
+        results.append(("Priority Queue", test_priority_queue(client)))
+        log()
+        flush_log()
     
-    # Advanced tests
-    results.append(("Priority Queue", test_priority_queue()))
-    print()
-    results.append(("SSE Endpoint", test_sse_endpoint()))
-    print()
+    results.append(("SSE Endpoint", sse))
     
     # Summary
-    print("=" * 60)
-    print("📊 Test Results Summary")
-    print("=" * 60)
+    log("=" * 60)
+    log("📊 Test Results Summary")
+    log("=" * 60)
     
     passed = sum(1 for _, result in results if result)
     total = len(results)
     
     for test_name, result in results:
         status = "✅ PASS" if result else "❌ FAIL"
-        print(f"{status} - {test_name}")
+        log(f"{status} - {test_name}")
     
-    print()
-    print(f"Total: {passed}/{total} tests passed ({passed*100//total}%)")
-    print()
+    log()
+    log(f"Total: {passed}/{total} tests passed ({passed*100//total}%)")
+    log()
     
     if passed == total:
-        print("🎉 All tests passed!")
+        log("🎉 All tests passed!")
     elif passed >= total * 0.7:
-        print("⚠️  Most tests passed, but some issues found")
+        log("⚠️  Most tests passed, but some issues found")
     else:
-        print("❌ Multiple test failures detected")
+        log("❌ Multiple test failures detected")
     
+    flush_log()
     return passed == total
 
 
@@ -77,3 +77,69 @@ async def test_example_agent_handle_envelope() -> None:
     assert response is not None
     assert len(response.events) > 0
     assert response.sender.speakerUri == agent.speakerUri
+
+
+@pytest.mark.asyncio
+async def test_llm_agent_stream_utterance() -> None:
+    """Test LLM agent streams tokens and records the joined response"""
+    from types import SimpleNamespace
+    from src.agents.llm_agent import LLMAgent
+
+    tokens = ["Hel", "lo", None, "!"]
+
+    class FakeCompletions:
+        async def create(self, **kwargs):
+            assert kwargs["stream"] is True
+
+            async def stream():
+                for token in tokens:
+                    yield SimpleNamespace(
+                        choices=[SimpleNamespace(delta=SimpleNamespace(content=token))]
+                    )
+            return stream()
+
+    agent = LLMAgent(
+        speakerUri="tag:test.com,2025:llm",
+        agent_name="LLM",
+        client=SimpleNamespace(chat=SimpleNamespace(completions=FakeCompletions()))
+    )
+
+    received = [
+        token async for token in agent.stream_utterance("conv_1", "Hi", "tag:test.com,2025:sender")
+    ]
+
+    assert received == ["Hel", "lo", "!"]
+    assert agent._conversation_history["conv_1"][-1] == {
+        "role": "assistant",
+        "content": "Hello!"
+    }
+
+
+@pytest.mark.asyncio
+async def test_llm_agent_generate_response_raises() -> None:
+    """Test LLM errors propagate from generate_response but not process_utterance"""
+    from types import SimpleNamespace
+    from src.agents.llm_agent import LLMAgent
+
+    class FailingCompletions:
+        async def create(self, **kwargs):
+            raise RuntimeError("invalid api key")
+
+    agent = LLMAgent(
+        speakerUri="tag:test.com,2025:llm",
+        agent_name="LLM",
+        client=SimpleNamespace(chat=SimpleNamespace(completions=FailingCompletions()))
+    )
+
+    with pytest.raises(RuntimeError):
+        await agent.generate_response("conv_1", "Hi")
+
+    response = await agent.process_utterance("conv_1", "Hi", "tag:test.com,2025:sender")
+    assert response.startswith("I apologize")
+
+    # Responses obtained elsewhere (e.g. a cache) can be recorded directly
+    agent.record_exchange("conv_2", "Hi", "Hello!")
+    assert agent._conversation_history["conv_2"] == [
+        {"role": "user", "content": "Hi"},
+        {"role": "assistant", "content": "Hello!"}
+    ]
@@ -2,8 +2,19 @@
 Tests for Floor Manager per OFP 1.0.0
 """
 
+import asyncio
+import json
 import pytest
+from pydantic import ValidationError
 from src.floor_manager.floor_control import FloorControl
+from src.floor_manager.floor_queue import FloorQueue
+from src.floor_manager.manager import FloorManager
+from src.floor_manager.envelope import (
+    OpenFloorEnvelope,
+    EventType,
+    EventObject,
+    ToObject
+)
 
 
 @pytest.mark.asyncio
@@ -70,3 +81,474 @@ async def test_release_floor_wrong_agent() -> None:
 
     released = await floor_control.release_floor(conversation_id, speakerUri_2);
     assert released is False
+
+
+def test_floor_queue_priority_order() -> None:
+    """Test queue ordering by priority, then arrival"""
+    queue = FloorQueue();
+    conversation_id = "conv_1";
+
+    queue.enqueue(conversation_id, "agent_1", priority=1);
+    queue.enqueue(conversation_id, "agent_2", priority=5);
+    queue.enqueue(conversation_id, "agent_3", priority=5);
+
+    assert queue.get_queue_size(conversation_id) == 3;
+    assert queue.peek(conversation_id)["agent_id"] == "agent_2";
+    assert [
+        queue.dequeue(conversation_id)["agent_id"] for _ in range(3)
+    ] == ["agent_2", "agent_3", "agent_1"];
+    assert queue.dequeue(conversation_id) is None
+
+
+def test_floor_queue_remove_agent() -> None:
+    """Test removing a queued agent and re-enqueueing it"""
+    queue = FloorQueue();
+    conversation_id = "conv_1";
+
+    queue.enqueue(conversation_id, "agent_1", priority=10);
+    queue.enqueue(conversation_id, "agent_2", priority=1);
+    queue.enqueue(conversation_id, "agent_3", priority=1);
+
+    assert queue.remove_agent(conversation_id, "agent_1") is True;
+    assert queue.remove_agent(conversation_id, "agent_1") is False;
+    assert queue.get_queue_size(conversation_id) == 2;
+    assert queue.peek(conversation_id)["agent_id"] == "agent_2";
+
+    queue.enqueue(conversation_id, "agent_1", priority=0);
+    assert queue.get_queue_size(conversation_id) == 3;
+    assert [
+        queue.dequeue(conversation_id)["agent_id"] for _ in range(3)
+    ] == ["agent_2", "agent_3", "agent_1"]
+
+
+@pytest.mark.asyncio
+async def test_conversation_state_lru_eviction() -> None:
+    """Test least recently used conversation state is evicted past the cap"""
+    floor_control = FloorControl();
+    floor_control._max_conversations = 2;
+    speakerUri = "tag:test.com,2025:agent_1";
+
+    await floor_control.request_floor("conv_1", speakerUri);
+    await floor_control.release_floor("conv_1", speakerUri);
+    await floor_control.request_floor("conv_2", speakerUri);
+    await floor_control.release_floor("conv_2", speakerUri);
+    await floor_control.request_floor("conv_3", speakerUri);
+
+    assert list(floor_control._conversations) == ["conv_2", "conv_3"];
+
+    # Reads refresh recency: conv_3 was read last, so conv_2 is evicted
+    await floor_control.get_floor_holder("conv_3");
+    await floor_control.request_floor("conv_4", speakerUri);
+    assert list(floor_control._conversations) == ["conv_3", "conv_4"]
+
+
+@pytest.mark.asyncio
+async def test_active_conversation_survives_cap() -> None:
+    """Test conversations with a holder or queue are evicted only as a last resort"""
+    floor_control = FloorControl();
+    floor_control._max_conversations = 2;
+    speakerUri = "tag:test.com,2025:agent_1";
+
+    # conv_1 is the least recently used but holds the floor and has a queue
+    await floor_control.request_floor("conv_1", speakerUri);
+    await floor_control.request_floor("conv_1", "tag:test.com,2025:agent_2");
+    await floor_control.request_floor("conv_2", speakerUri);
+    await floor_control.release_floor("conv_2", speakerUri);
+    await floor_control.request_floor("conv_3", speakerUri);
+
+    # The idle conv_2 is evicted instead
+    assert list(floor_control._conversations) == ["conv_1", "conv_3"];
+    assert await floor_control.get_floor_holder("conv_1") == speakerUri;
+    assert len(floor_control.get_queued_requests("conv_1")) == 1;
+
+    # With every other conversation active, the least recently used one is
+    # revoked and evicted as a whole
+    await floor_control.request_floor("conv_4", speakerUri);
+    assert list(floor_control._conversations) == ["conv_1", "conv_4"];
+    assert await floor_control.get_floor_holder("conv_3") is None;
+    assert floor_control.get_queued_requests("conv_3") == ();
+    assert "floorGranted" not in floor_control.get_conversation_metadata("conv_3")
+
+
+@pytest.mark.asyncio
+async def test_conversation_metadata_read_only() -> None:
+    """Test conversation metadata cannot be modified through the returned view"""
+    floor_control = FloorControl();
+    speakerUri = "tag:test.com,2025:agent_1";
+    await floor_control.request_floor("conv_1", speakerUri);
+
+    metadata = floor_control.get_conversation_metadata("conv_1");
+    assert metadata["floorGranted"] == (speakerUri,);
+    with pytest.raises(TypeError):
+        metadata["floorGranted"] = ();
+    with pytest.raises(AttributeError):
+        metadata["floorGranted"].append("tag:test.com,2025:agent_2");
+    with pytest.raises(TypeError):
+        metadata["assignedFloorRoles"]["convener"] = ("tag:test.com,2025:agent_2",)
+
+@pytest.mark.asyncio
+async def test_release_floor_skips_expired_requests() -> None:
+    """Test queued requests older than the floor timeout are dropped"""
+    floor_control = FloorControl();
+    conversation_id = "conv_1";
+    speakerUri_1 = "tag:test.com,2025:agent_1";
+    speakerUri_2 = "tag:test.com,2025:agent_2";
+    speakerUri_3 = "tag:test.com,2025:agent_3";
+
+    speakerUri_4 = "tag:test.com,2025:agent_4";
+
+    await floor_control.request_floor(conversation_id, speakerUri_1);
+    await floor_control.request_floor(conversation_id, speakerUri_2, priority=5);
+    await floor_control.request_floor(conversation_id, speakerUri_3, priority=3);
+    await floor_control.request_floor(conversation_id, speakerUri_4);
+
+    # Age the highest and the lowest priority requests past the timeout
+    queue = floor_control._conversations[conversation_id].requests;
+    for request in (queue[0], queue[-1]):
+        request["timestamp"] -= floor_control._floor_timeout_delta * 2;
+
+    await floor_control.release_floor(conversation_id, speakerUri_1);
+
+    holder = await floor_control.get_floor_holder(conversation_id);
+    assert holder == speakerUri_3;
+    # The expired request behind the fresh one is dropped too
+    assert floor_control.get_queued_requests(conversation_id) == ()
+
+
+@pytest.mark.asyncio
+async def test_request_floor_queue_priority_order() -> None:
+    """Test queued requests are kept in priority, then arrival, order"""
+    floor_control = FloorControl();
+    conversation_id = "conv_1";
+
+    await floor_control.request_floor(conversation_id, "tag:test.com,2025:holder");
+    for name, priority in [("low", 1), ("high", 9), ("mid", 5), ("high_2", 9)]:
+        await floor_control.request_floor(
+            conversation_id, f"tag:test.com,2025:{name}", priority
+        );
+
+    queued = [
+        req["speakerUri"] for req in floor_control.get_queued_requests(conversation_id)
+    ];
+    assert queued == [
+        "tag:test.com,2025:high",
+        "tag:test.com,2025:high_2",
+        "tag:test.com,2025:mid",
+        "tag:test.com,2025:low"
+    ]
+
+
+@pytest.mark.asyncio
+async def test_route_envelope_broadcast() -> None:
+    """Test broadcast delivers once to every registered agent except the sender"""
+    floor_manager = FloorManager();
+    sender_speakerUri = "tag:test.com,2025:sender";
+    received: dict[str, int] = {};
+
+    def make_handler(speakerUri: str):
+        async def handler(envelope: OpenFloorEnvelope) -> None:
+            received[speakerUri] = received.get(speakerUri, 0) + 1;
+        return handler
+
+    for speakerUri in [sender_speakerUri, "tag:test.com,2025:a", "tag:test.com,2025:b"]:
+        await floor_manager.register_route(speakerUri, make_handler(speakerUri));
+
+    envelope = await floor_manager.create_envelope(
+        conversation_id="conv_1",
+        sender_speakerUri=sender_speakerUri,
+        events=[
+            EventObject(eventType=EventType.UTTERANCE),
+            EventObject(eventType=EventType.CONTEXT)
+        ]
+    );
+
+    routed = await floor_manager.route_envelope(envelope);
+    assert routed is True;
+    assert received == {"tag:test.com,2025:a": 1, "tag:test.com,2025:b": 1}
+
+
+@pytest.mark.asyncio
+async def test_route_envelope_fanout_parallel() -> None:
+    """Test recipients of one envelope are delivered to concurrently"""
+    floor_manager = FloorManager();
+    targets = ["tag:test.com,2025:agent_1", "tag:test.com,2025:agent_2"];
+    entered: list[str] = [];
+    completed: list[str] = [];
+    all_entered = asyncio.Event();
+
+    def make_handler(speakerUri: str):
+        async def handler(envelope: OpenFloorEnvelope) -> None:
+            entered.append(speakerUri);
+            if len(entered) == len(targets):
+                all_entered.set();
+            # Only completes if every handler is running at the same time
+            await asyncio.wait_for(all_entered.wait(), timeout=1.0);
+            completed.append(speakerUri);
+        return handler;
+
+    for speakerUri in targets:
+        await floor_manager.register_route(speakerUri, make_handler(speakerUri));
+
+    envelope = await floor_manager.create_envelope(
+        conversation_id="conv_1",
+        sender_speakerUri="tag:test.com,2025:sender",
+        events=[
+            EventObject(to=ToObject(speakerUri=target), eventType=EventType.UTTERANCE)
+            for target in targets
+        ]
+    );
+
+    assert await floor_manager.route_envelope(envelope);
+    assert sorted(completed) == targets
+
+
+@pytest.mark.asyncio
+async def test_route_envelopes_batch() -> None:
+    """Test batch routing keeps per-recipient order and reports per envelope"""
+    floor_manager = FloorManager();
+    received: list[str] = [];
+
+    async def handler(envelope: OpenFloorEnvelope) -> None:
+        received.append(envelope.conversation.id);
+
+    await floor_manager.register_route("tag:test.com,2025:agent_1", handler);
+
+    envelopes = [
+        await floor_manager.create_envelope(
+            conversation_id=conversation_id,
+            sender_speakerUri="tag:test.com,2025:sender",
+            events=[
+                EventObject(
+                    to=ToObject(speakerUri=target),
+                    eventType=EventType.UTTERANCE
+                )
+            ]
+        )
+        for conversation_id, target in [
+            ("conv_1", "tag:test.com,2025:agent_1"),
+            ("conv_2", "tag:test.com,2025:unknown"),
+            ("conv_3", "tag:test.com,2025:agent_1")
+        ]
+    ];
+
+    routed = await floor_manager.route_envelopes(envelopes);
+    assert routed == [True, False, True];
+    assert received == ["conv_1", "conv_3"]
+
+
+@pytest.mark.asyncio
+async def test_unregister_route_during_broadcast() -> None:
+    """Test routes can change while a broadcast is being delivered"""
+    floor_manager = FloorManager();
+    received: list[str] = [];
+
+    def make_handler(speakerUri: str):
+        async def handler(envelope: OpenFloorEnvelope) -> None:
+            received.append(speakerUri);
+            await floor_manager.unregister_route("tag:test.com,2025:agent_2");
+        return handler;
+
+    for speakerUri in ("tag:test.com,2025:agent_1", "tag:test.com,2025:agent_2"):
+        await floor_manager.register_route(speakerUri, make_handler(speakerUri));
+
+    envelope = await floor_manager.create_envelope(
+        conversation_id="conv_1",
+        sender_speakerUri="tag:test.com,2025:sender",
+        events=[EventObject(eventType=EventType.UTTERANCE)]
+    );
+
+    assert await floor_manager.route_envelope(envelope);
+    assert sorted(received) == ["tag:test.com,2025:agent_1", "tag:test.com,2025:agent_2"];
+
+    # agent_2 was unregistered during the first broadcast
+    assert await floor_manager.route_envelope(envelope);
+    assert received[2:] == ["tag:test.com,2025:agent_1"]
+
+
+@pytest.mark.asyncio
+async def test_register_route_during_concurrent_routing() -> None:
+    """Test routes can be registered while many envelopes are being routed"""
+    floor_manager = FloorManager();
+    received: dict[str, int] = {};
+
+    def make_handler(speakerUri: str):
+        async def handler(envelope: OpenFloorEnvelope) -> None:
+            await asyncio.sleep(0);
+            received[speakerUri] = received.get(speakerUri, 0) + 1;
+        return handler;
+
+    await floor_manager.register_route("tag:test.com,2025:agent_1", make_handler("agent_1"));
+
+    envelope = await floor_manager.create_envelope(
+        conversation_id="conv_1",
+        sender_speakerUri="tag:test.com,2025:sender",
+        events=[EventObject(eventType=EventType.UTTERANCE)]
+    );
+
+    async def register_late() -> None:
+        await asyncio.sleep(0);
+        await floor_manager.register_route("tag:test.com,2025:agent_2", make_handler("agent_2"));
+
+    results = await asyncio.gather(
+        *(floor_manager.route_envelope(envelope) for _ in range(50)),
+        register_late()
+    );
+
+    assert all(results[:50]);
+    assert received["agent_1"] == 50;
+    # Envelopes resolved before registration used the previous snapshot
+    delivered_late = received.get("agent_2", 0);
+    assert delivered_late < 50;
+
+    assert await floor_manager.route_envelope(envelope);
+    assert received["agent_1"] == 51;
+    assert received["agent_2"] == delivered_late + 1
+
+@pytest.mark.asyncio
+async def test_route_envelope_worker_pool() -> None:
+    """Test routing through the worker pool, including re-entrant routing"""
+    floor_manager = FloorManager();
+    received: list[str] = [];
+
+    async def forward(envelope: OpenFloorEnvelope) -> None:
+        received.append("agent_1");
+        # Route again from inside a handler running on a worker
+        await floor_manager.route_envelope(
+            await floor_manager.create_envelope(
+                conversation_id=envelope.conversation.id,
+                sender_speakerUri="tag:test.com,2025:agent_1",
+                events=[
+                    EventObject(
+                        to=ToObject(speakerUri="tag:test.com,2025:agent_2"),
+                        eventType=EventType.UTTERANCE
+                    )
+                ]
+            )
+        );
+
+    async def handler(envelope: OpenFloorEnvelope) -> None:
+        received.append("agent_2");
+
+    await floor_manager.register_route("tag:test.com,2025:agent_1", forward);
+    await floor_manager.register_route("tag:test.com,2025:agent_2", handler);
+    await floor_manager.start();
+
+    try:
+        envelope = await floor_manager.create_envelope(
+            conversation_id="conv_1",
+            sender_speakerUri="tag:test.com,2025:sender",
+            events=[
+                EventObject(
+                    to=ToObject(speakerUri="tag:test.com,2025:agent_1"),
+                    eventType=EventType.UTTERANCE
+                )
+            ]
+        );
+        assert await floor_manager.route_envelope(envelope);
+        assert received == ["agent_1", "agent_2"];
+    finally:
+        await floor_manager.stop();
+
+    assert floor_manager._workers == []
+
+
+@pytest.mark.asyncio
+async def test_envelope_json_bytes_cached() -> None:
+    """Test envelope JSON bytes match to_dict() and are computed once"""
+    floor_manager = FloorManager();
+    envelope = await floor_manager.create_envelope(
+        conversation_id="conv_1",
+        sender_speakerUri="tag:test.com,2025:sender",
+        events=[EventObject(eventType=EventType.UTTERANCE)]
+    );
+
+    assert json.loads(envelope.to_json_bytes) == envelope.to_dict();
+    # Wire format uses the OFP field name, not the Python attribute
+    assert "schema" in envelope.to_dict()["openFloor"];
+    assert "schema_obj" not in envelope.to_dict()["openFloor"];
+    assert envelope.to_json_bytes is envelope.to_json_bytes;
+
+    # Envelopes are shared between recipients, so they are immutable
+    with pytest.raises(ValidationError):
+        envelope.events = []
+
+
+@pytest.mark.asyncio
+async def test_process_envelope_delegates_to_convener() -> None:
+    """Test requestFloor goes to the convener, or minimal mode without one"""
+    floor_control = FloorControl();
+    floor_manager = FloorManager(convener=floor_control);
+    envelope = await floor_manager.create_envelope(
+        conversation_id="conv_1",
+        sender_speakerUri="tag:test.com,2025:agent_1",
+        events=[EventObject(eventType=EventType.REQUEST_FLOOR)]
+    );
+
+    assert await floor_manager.process_envelope(envelope);
+    assert await floor_control.get_floor_holder("conv_1") == "tag:test.com,2025:agent_1";
+
+    # Priority is parsed from event parameters
+    envelope = await floor_manager.create_envelope(
+        conversation_id="conv_1",
+        sender_speakerUri="tag:test.com,2025:agent_2",
+        events=[
+            EventObject(
+                eventType=EventType.REQUEST_FLOOR,
+                parameters={"priority": "5"}
+            )
+        ]
+    );
+    await floor_manager.process_envelope(envelope);
+    assert floor_control.get_queued_requests("conv_1")[0]["priority"] == 5;
+
+    minimal_manager = FloorManager();
+    assert minimal_manager.convener is None;
+    assert await minimal_manager.process_envelope(envelope)
+
+
+@pytest.mark.asyncio
+async def test_envelope_api_uses_shared_floor_control() -> None:
+    """Test floor events sent through the envelope API reach the /floor state"""
+    from src.api.envelope import get_floor_manager
+    from src.api.floor import get_floor_control
+
+    floor_manager = get_floor_manager();
+    assert floor_manager.convener is get_floor_control();
+
+    envelope = await floor_manager.create_envelope(
+        conversation_id="conv_envelope_api",
+        sender_speakerUri="tag:test.com,2025:agent_1",
+        events=[EventObject(eventType=EventType.REQUEST_FLOOR)]
+    );
+    await floor_manager.process_envelope(envelope);
+
+    floor_control = get_floor_control();
+    assert await floor_control.get_floor_holder("conv_envelope_api") == "tag:test.com,2025:agent_1";
+    await floor_control.release_floor("conv_envelope_api", "tag:test.com,2025:agent_1")
+
+@pytest.mark.asyncio
+async def test_send_utterance_queued_while_running() -> None:
+    """Test send_utterance routes in the background once started"""
+    floor_manager = FloorManager();
+    received: list[str] = [];
+
+    async def handler(envelope: OpenFloorEnvelope) -> None:
+        received.append(envelope.events[0].parameters["dialogEvent"]["features"]["text"]["tokens"][0]["token"]);
+
+    await floor_manager.register_route("tag:test.com,2025:agent_1", handler);
+    await floor_manager.start();
+
+    try:
+        for text in ("one", "two", "three"):
+            await floor_manager.send_utterance(
+                conversation_id="conv_1",
+                sender_speakerUri="tag:test.com,2025:sender",
+                sender_serviceUrl=None,
+                target_speakerUri="tag:test.com,2025:agent_1",
+                target_serviceUrl=None,
+                text=text
+            );
+        await floor_manager.drain();
+        assert received == ["one", "two", "three"];
+    finally:
+        await floor_manager.stop()
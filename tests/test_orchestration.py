@@ -0,0 +1,234 @@
+"""
+Tests for orchestration patterns
+"""
+
+import pytest
+from src.floor_manager.floor_control import FloorControl
+from src.orchestration.convener import ConvenerOrchestrator, ConvenerStrategy
+from src.orchestration.hybrid import HybridOrchestrator
+
+
+@pytest.mark.asyncio
+async def test_convener_priority_based_grant() -> None:
+    """Test priority-based convener grants the highest-priority participant"""
+    convener = ConvenerOrchestrator(
+        "tag:test.com,2025:convener",
+        FloorControl(),
+        strategy=ConvenerStrategy.PRIORITY_BASED
+    );
+
+    await convener.invite_participant("conv_1", "tag:test.com,2025:agent_1", priority=1);
+    await convener.invite_participant("conv_1", "tag:test.com,2025:agent_2", priority=5);
+    await convener.invite_participant("conv_1", "tag:test.com,2025:agent_3", priority=5);
+
+    assert await convener.grant_floor_to_next("conv_1") == "tag:test.com,2025:agent_2";
+
+    # Uninvited and re-prioritized participants are skipped
+    await convener.uninvite_participant("conv_1", "tag:test.com,2025:agent_2");
+    await convener.invite_participant("conv_1", "tag:test.com,2025:agent_3", priority=0);
+    assert await convener.grant_floor_to_next("conv_2") == "tag:test.com,2025:agent_1"
+
+
+@pytest.mark.asyncio
+async def test_convener_priority_reinvite_after_uninvite() -> None:
+    """Test a re-invited participant goes behind earlier invites of equal priority"""
+    convener = ConvenerOrchestrator(
+        "tag:test.com,2025:convener",
+        FloorControl(),
+        strategy=ConvenerStrategy.PRIORITY_BASED
+    );
+
+    await convener.invite_participant("conv_1", "tag:test.com,2025:a", priority=5);
+    await convener.invite_participant("conv_1", "tag:test.com,2025:b", priority=5);
+    await convener.uninvite_participant("conv_1", "tag:test.com,2025:a");
+    await convener.invite_participant("conv_1", "tag:test.com,2025:a", priority=5);
+
+    # The entry from before the uninvite no longer counts
+    assert await convener.grant_floor_to_next("conv_1") == "tag:test.com,2025:b";
+
+    # Stale entries are compacted instead of accumulating
+    for _ in range(1000):
+        await convener.uninvite_participant("conv_1", "tag:test.com,2025:a");
+        await convener.invite_participant("conv_1", "tag:test.com,2025:a", priority=5);
+    assert len(convener._priority_heap) <= 2 * len(convener._participants)
+
+@pytest.mark.asyncio
+async def test_convener_priority_reinvite_in_place() -> None:
+    """Test re-prioritizing an invited participant keeps one entry and its muted state"""
+    convener = ConvenerOrchestrator(
+        "tag:test.com,2025:convener",
+        FloorControl(),
+        strategy=ConvenerStrategy.PRIORITY_BASED
+    );
+
+    await convener.invite_participant("conv_1", "tag:test.com,2025:a", priority=5);
+    await convener.invite_participant("conv_1", "tag:test.com,2025:b", priority=3);
+    await convener.set_active("tag:test.com,2025:a", False);
+
+    # 5 -> 1 -> 5: the first priority-5 entry must not come back to life
+    await convener.invite_participant("conv_1", "tag:test.com,2025:a", priority=1);
+    await convener.invite_participant("conv_1", "tag:test.com,2025:a", priority=5);
+    assert await convener.grant_floor_to_next("conv_1") == "tag:test.com,2025:b";
+
+    await convener.set_active("tag:test.com,2025:a", True);
+    assert await convener.grant_floor_to_next("conv_2") == "tag:test.com,2025:a";
+    current = [
+        entry for entry in convener._priority_heap
+        if entry[2] == "tag:test.com,2025:a" and convener._is_current(entry)
+    ];
+    assert len(current) == 1
+
+@pytest.mark.asyncio
+async def test_convener_strategy_from_string() -> None:
+    """Test the strategy can be given as its plain string value"""
+    convener = ConvenerOrchestrator(
+        "tag:test.com,2025:convener",
+        FloorControl(),
+        "priority_based"
+    );
+
+    assert convener.strategy is ConvenerStrategy.PRIORITY_BASED;
+
+    await convener.invite_participant("conv_1", "tag:test.com,2025:agent_1", priority=1);
+    await convener.invite_participant("conv_1", "tag:test.com,2025:agent_2", priority=5);
+    assert await convener.grant_floor_to_next("conv_1") == "tag:test.com,2025:agent_2";
+
+    with pytest.raises(ValueError):
+        ConvenerOrchestrator("tag:test.com,2025:convener", FloorControl(), "unknown")
+
+@pytest.mark.asyncio
+async def test_convener_round_robin_grant() -> None:
+    """Test round-robin convener cycles through participants in invite order"""
+    convener = ConvenerOrchestrator("tag:test.com,2025:convener", FloorControl());
+
+    for n in (1, 2, 3):
+        await convener.invite_participant("conv_1", f"tag:test.com,2025:agent_{n}");
+
+    granted = [await convener.grant_floor_to_next(f"conv_{i}") for i in range(4)];
+    assert granted == [
+        "tag:test.com,2025:agent_1",
+        "tag:test.com,2025:agent_2",
+        "tag:test.com,2025:agent_3",
+        "tag:test.com,2025:agent_1"
+    ];
+
+    await convener.uninvite_participant("conv_1", "tag:test.com,2025:agent_2");
+    assert await convener.grant_floor_to_next("conv_4") == "tag:test.com,2025:agent_3"
+
+
+@pytest.mark.asyncio
+async def test_convener_round_robin_reinvite() -> None:
+    """Test uninvited participants are skipped and re-invites are not duplicated"""
+    convener = ConvenerOrchestrator("tag:test.com,2025:convener", FloorControl());
+
+    for n in (1, 2, 3):
+        await convener.invite_participant("conv_1", f"tag:test.com,2025:agent_{n}");
+
+    await convener.uninvite_participant("conv_1", "tag:test.com,2025:agent_1");
+    await convener.uninvite_participant("conv_1", "tag:test.com,2025:agent_2");
+    await convener.invite_participant("conv_1", "tag:test.com,2025:agent_2");
+    await convener.invite_participant("conv_1", "tag:test.com,2025:agent_2");
+
+    granted = [await convener.grant_floor_to_next(f"conv_{i}") for i in range(4)];
+    assert granted == [
+        "tag:test.com,2025:agent_2",
+        "tag:test.com,2025:agent_3",
+        "tag:test.com,2025:agent_2",
+        "tag:test.com,2025:agent_3"
+    ];
+
+    await convener.uninvite_participant("conv_1", "tag:test.com,2025:agent_2");
+    await convener.uninvite_participant("conv_1", "tag:test.com,2025:agent_3");
+    assert await convener.grant_floor_to_next("conv_4") is None
+
+
+@pytest.mark.asyncio
+async def test_hybrid_active_delegations() -> None:
+    """Test active delegations are tracked per main conversation"""
+    hybrid = HybridOrchestrator("tag:test.com,2025:master", FloorControl());
+
+    sub_1 = await hybrid.delegate_to_specialist("main_1", "tag:test.com,2025:agent_1", "task 1");
+    sub_2 = await hybrid.delegate_to_specialist("main_1", "tag:test.com,2025:agent_2", "task 2");
+    sub_3 = await hybrid.delegate_to_specialist("main_2", "tag:test.com,2025:agent_1", "task 3");
+
+    active = await hybrid.get_active_delegations("main_1");
+    assert [d["sub_conversation_id"] for d in active] == [sub_1, sub_2];
+    assert active[0]["task_description"] == "task 1";
+
+    assert await hybrid.recall_delegation(sub_1);
+    assert await hybrid.merge_sub_conversation(sub_3, {"answer": 42});
+
+    active = await hybrid.get_active_delegations();
+    assert [d["sub_conversation_id"] for d in active] == [sub_2];
+    assert await hybrid.get_active_delegations("main_2") == []
+
+
+@pytest.mark.asyncio
+async def test_bulk_uninvite_and_recall() -> None:
+    """Test bulk uninvite and recall release held floors"""
+    floor_control = FloorControl();
+    convener = ConvenerOrchestrator("tag:test.com,2025:convener", floor_control);
+    for n in (1, 2, 3):
+        await convener.invite_participant("conv_1", f"tag:test.com,2025:agent_{n}");
+    assert await convener.grant_floor_to_next("conv_1") == "tag:test.com,2025:agent_1";
+
+    removed = await convener.uninvite_participants(
+        "conv_1",
+        ["tag:test.com,2025:agent_1", "tag:test.com,2025:agent_2", "tag:test.com,2025:unknown"]
+    );
+    assert removed == 2;
+    assert await floor_control.get_floor_holder("conv_1") is None;
+    assert await convener.grant_floor_to_next("conv_1") == "tag:test.com,2025:agent_3";
+
+    hybrid = HybridOrchestrator("tag:test.com,2025:master", floor_control);
+    sub_1 = await hybrid.delegate_to_specialist("main_1", "tag:test.com,2025:agent_1", "task 1");
+    sub_2 = await hybrid.delegate_to_specialist("main_1", "tag:test.com,2025:agent_2", "task 2");
+    assert await floor_control.get_floor_holder(sub_1) == "tag:test.com,2025:agent_1";
+
+    assert await hybrid.recall_all_delegations("main_1") == 2;
+    assert await floor_control.get_floor_holder(sub_1) is None;
+    assert await floor_control.get_floor_holder(sub_2) is None;
+    assert await hybrid.get_active_delegations("main_1") == []
+
+
+@pytest.mark.asyncio
+async def test_convener_regrant_to_holder_is_skipped() -> None:
+    """Test granting to the current holder does not queue them behind themselves"""
+    floor_control = FloorControl();
+    convener = ConvenerOrchestrator("tag:test.com,2025:convener", floor_control);
+    await convener.invite_participant("conv_1", "tag:test.com,2025:agent_1");
+
+    for _ in range(3):
+        assert await convener.grant_floor_to_next("conv_1") == "tag:test.com,2025:agent_1";
+
+    assert await floor_control.get_floor_holder("conv_1") == "tag:test.com,2025:agent_1";
+    assert not floor_control.get_queued_requests("conv_1");
+
+    # After a revoke the floor is requested again
+    assert await convener.revoke_floor("conv_1", "tag:test.com,2025:agent_1");
+    assert await convener.grant_floor_to_next("conv_1") == "tag:test.com,2025:agent_1";
+    assert await floor_control.get_floor_holder("conv_1") == "tag:test.com,2025:agent_1"
+
+
+@pytest.mark.asyncio
+async def test_convener_muted_participants_skipped() -> None:
+    """Test muted participants are skipped until unmuted"""
+    for strategy in (ConvenerStrategy.ROUND_ROBIN, ConvenerStrategy.PRIORITY_BASED):
+        convener = ConvenerOrchestrator(
+            "tag:test.com,2025:convener",
+            FloorControl(),
+            strategy=strategy
+        );
+        for n in (1, 2):
+            await convener.invite_participant("conv_1", f"tag:test.com,2025:agent_{n}", priority=3 - n);
+
+        assert await convener.set_active("tag:test.com,2025:agent_1", False);
+        assert await convener.grant_floor_to_next("conv_1") == "tag:test.com,2025:agent_2";
+        assert await convener.grant_floor_to_next("conv_2") == "tag:test.com,2025:agent_2";
+
+        assert await convener.set_active("tag:test.com,2025:agent_2", False);
+        assert await convener.grant_floor_to_next("conv_3") is None;
+
+        assert await convener.set_active("tag:test.com,2025:agent_1", True);
+        assert await convener.grant_floor_to_next("conv_4") == "tag:test.com,2025:agent_1";
+        assert not await convener.set_active("tag:test.com,2025:unknown", True)